@@ -0,0 +1 @@
+"""Benchmarks for parsers, selectors, helpers and pipelines."""
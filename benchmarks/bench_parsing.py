@@ -0,0 +1,68 @@
+"""
+Parsing Benchmarks
+BeautifulSoup backends, the find_all vs select styles from 01_css_selectors.py,
+and row-by-row vs columnar table extraction.
+"""
+
+from functools import partial
+
+from bs4 import BeautifulSoup, FeatureNotFound
+
+from utils.tables import read_table
+from .synthetic import generate_catalog
+
+PARSERS = ('html.parser', 'lxml', 'html5lib')
+
+
+def available_parsers():
+    """Return the BeautifulSoup backends installed in this environment."""
+    parsers = []
+    for parser in PARSERS:
+        try:
+            BeautifulSoup('', parser)
+            parsers.append(parser)
+        except FeatureNotFound:
+            print(f"⚠ Skipping parser '{parser}': not installed")
+    return parsers
+
+
+def prices_with_find_all(soup):
+    """Collect prices by walking product divs with find_all()/find()."""
+    return [product.find('p', class_='price').get_text()
+            for product in soup.find_all(class_='product')]
+
+
+def prices_with_select(soup):
+    """Collect prices with a single CSS selector."""
+    return [price.get_text() for price in soup.select('div.product p.price')]
+
+
+def table_with_row_loop(html):
+    """Extract the comparison table the way the tutorials do: a dict per row."""
+    soup = BeautifulSoup(html, 'lxml')
+    table = soup.find('table', id='comparison')
+    headers = [th.get_text().strip() for th in table.find_all('th')]
+    return [dict(zip(headers, [td.get_text().strip() for td in tr.find_all('td')]))
+            for tr in table.find('tbody').find_all('tr')]
+
+
+def cases(sizes):
+    """
+    Yield (name, callable) benchmark cases for each page size.
+
+    Args:
+        sizes: Iterable of product counts
+    """
+    parsers = available_parsers()
+    for n in sizes:
+        html = generate_catalog(n)
+        for parser in parsers:
+            yield f'parse[{parser}]/n={n}', partial(BeautifulSoup, html, parser)
+
+        soup = BeautifulSoup(html, 'lxml' if 'lxml' in parsers else 'html.parser')
+        yield f'find_all/n={n}', partial(prices_with_find_all, soup)
+        yield f'select/n={n}', partial(prices_with_select, soup)
+
+        if 'lxml' in parsers:
+            yield f'table[row_loop]/n={n}', partial(table_with_row_loop, html)
+            yield f'table[read_table]/n={n}', partial(read_table, html, '//table[@id="comparison"]')
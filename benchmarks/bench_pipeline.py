@@ -0,0 +1,59 @@
+"""
+Cleaning and Pipeline Benchmarks
+Throughput of utils.helpers.clean_text and the Scrapy CleanDataPipeline.
+"""
+
+import sys
+from functools import partial
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from utils.helpers import clean_text
+from .synthetic import generate_catalog
+
+SCRAPY_PROJECT = Path(__file__).parent.parent / 'modules' / '04_scrapy' / 'project_template'
+
+
+def load_pipeline():
+    """Import CleanDataPipeline from the Scrapy project template, if possible."""
+    if str(SCRAPY_PROJECT) not in sys.path:
+        sys.path.insert(0, str(SCRAPY_PROJECT))
+    try:
+        from tutorial_scrapy.pipelines import CleanDataPipeline
+    except ImportError as e:
+        print(f"⚠ Skipping CleanDataPipeline benchmarks: {e}")
+        return None
+    return CleanDataPipeline()
+
+
+def clean_all(texts):
+    """Run clean_text() over every text."""
+    return [clean_text(text) for text in texts]
+
+
+def run_pipeline(pipeline, items):
+    """Push fresh copies of items through the pipeline."""
+    return [pipeline.process_item(dict(item), None) for item in items]
+
+
+def cases(sizes):
+    """
+    Yield (name, callable) benchmark cases for each page size.
+
+    Args:
+        sizes: Iterable of product counts
+    """
+    pipeline = load_pipeline()
+    for n in sizes:
+        soup = BeautifulSoup(generate_catalog(n), 'html.parser')
+        products = soup.select('div.product')
+
+        texts = [product.get_text() for product in products]
+        yield f'clean_text/n={n}', partial(clean_all, texts)
+
+        if pipeline is not None:
+            items = [{'title': product.h3.get_text(),
+                      'price': product.select_one('p.price').get_text()}
+                     for product in products]
+            yield f'CleanDataPipeline/n={n}', partial(run_pipeline, pipeline, items)
@@ -0,0 +1,105 @@
+"""
+Validator Benchmarks
+Per-URL cost of utils.validators on large, repetitive link sets, compared
+with the previous uncached/uncompiled implementations.
+"""
+
+import random
+import re
+from functools import partial
+from urllib.parse import urlparse
+
+from utils.validators import (
+    extract_domains,
+    is_valid_email,
+    parse_url,
+    sanitize_filename,
+    validate_urls,
+)
+
+# Links discovered by a crawler repeat heavily and unevenly (navigation,
+# pagination and popular products appear on every page), so draw each set
+# from a pool of unique URLs with Zipf-like popularity.
+LINKS_PER_PRODUCT = 20
+UNIQUE_FRACTION = 0.05
+
+
+def generate_links(n: int, seed: int = 0) -> list:
+    """Build n links drawn from n * UNIQUE_FRACTION distinct URLs (Zipf-like)."""
+    rng = random.Random(seed)
+    unique = [f'https://shop{i % 50}.example.com/product/{i}?ref=list'
+              for i in range(max(1, int(n * UNIQUE_FRACTION)))]
+    weights = [1 / rank for rank in range(1, len(unique) + 1)]
+    return rng.choices(unique, weights=weights, k=n)
+
+
+def old_is_valid_url(url):
+    """Previous is_valid_url(): parses the URL on every call."""
+    try:
+        result = urlparse(url)
+        return all([result.scheme, result.netloc])
+    except Exception:
+        return False
+
+
+def old_extract_domain(url):
+    """Previous extract_domain(): parses the URL on every call."""
+    try:
+        return urlparse(url).netloc
+    except Exception:
+        return None
+
+
+def old_is_valid_email(email):
+    """Previous is_valid_email(): looks the pattern up in re's cache each call."""
+    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
+    return bool(re.match(pattern, email))
+
+
+def old_sanitize_filename(filename):
+    """Previous sanitize_filename(): looks the pattern up in re's cache each call."""
+    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    return filename.replace(' ', '_')[:255]
+
+
+def validate_and_extract_old(links):
+    """Validate every link and extract its domain, parsing each twice."""
+    return [old_extract_domain(link) for link in links if old_is_valid_url(link)]
+
+
+def validate_and_extract_cached(links):
+    """Same work through the shared parse cache, starting cold."""
+    parse_url.cache_clear()
+    valid = validate_urls(links)
+    return [domain for domain, ok in zip(extract_domains(links), valid) if ok]
+
+
+def apply_all(func, values):
+    """Call func on every value, as the validators were used before batching."""
+    return [func(value) for value in values]
+
+
+def cases(sizes):
+    """
+    Yield (name, callable, items) benchmark cases for each size.
+
+    Each size is a product count; the link set has LINKS_PER_PRODUCT links
+    per product (100k products -> 2M links). items is the number of links,
+    emails or filenames per call, for the per-item figure.
+
+    Args:
+        sizes: Iterable of product counts
+    """
+    for n in sizes:
+        links = generate_links(n * LINKS_PER_PRODUCT)
+        count = len(links)
+        yield f'urls[urlparse]/links={count}', partial(validate_and_extract_old, links), count
+        yield f'urls[cached]/links={count}', partial(validate_and_extract_cached, links), count
+
+        emails = [f'user{i}@example{i % 7}.com' for i in range(n)]
+        yield f'email[re.match]/n={n}', partial(apply_all, old_is_valid_email, emails), n
+        yield f'email[compiled]/n={n}', partial(apply_all, is_valid_email, emails), n
+
+        names = [f'Product {i}: "Deluxe" <v2>?.html' for i in range(n)]
+        yield f'filename[regex]/n={n}', partial(apply_all, old_sanitize_filename, names), n
+        yield f'filename[compiled]/n={n}', partial(apply_all, sanitize_filename, names), n
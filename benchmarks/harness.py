@@ -0,0 +1,145 @@
+"""
+Benchmark Harness
+Time and memory measurement plus a JSON-lines history for regression checks.
+"""
+
+import json
+import platform
+import statistics
+import subprocess
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+RESULTS_DIR = Path(__file__).parent / 'results'
+HISTORY_FILE = RESULTS_DIR / 'history.jsonl'
+
+
+def measure(func: Callable, repeat: int = 5, number: int = 1,
+            items: Optional[int] = None) -> Dict:
+    """
+    Time a callable and record its peak Python heap usage.
+
+    Timing runs are done without tracemalloc so its overhead does not
+    skew the numbers; one extra run is traced for memory.
+
+    Args:
+        func: Zero-argument callable to benchmark
+        repeat: Number of timed samples
+        number: Calls per sample
+        items: Items processed per call, to also report the median per item
+
+    Returns:
+        Dict with min/median seconds per call and peak_kb (plus
+        per_item seconds if items was given)
+    """
+    func()  # warm-up
+
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        samples.append((time.perf_counter() - start) / number)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    result = {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'peak_kb': round(peak / 1024, 1),
+    }
+    if items:
+        result['per_item'] = result['median'] / items
+    return result
+
+
+def _git_commit() -> Optional[str]:
+    """Return the current git commit hash, if available."""
+    try:
+        out = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'],
+                             capture_output=True, text=True, check=True,
+                             cwd=Path(__file__).parent)
+        return out.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path: Path = HISTORY_FILE) -> list:
+    """
+    Load previous benchmark runs.
+
+    Args:
+        path: JSON-lines history file
+
+    Returns:
+        List of run records, oldest first
+    """
+    if not path.exists():
+        return []
+    with open(path, 'r', encoding='utf-8') as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_run(results: Dict, path: Path = HISTORY_FILE) -> Dict:
+    """
+    Append a run to the history file.
+
+    Args:
+        results: Mapping of case name to measure() output
+        path: JSON-lines history file
+
+    Returns:
+        The stored run record
+    """
+    record = {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'results': results,
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'a', encoding='utf-8') as f:
+        f.write(json.dumps(record) + '\n')
+    return record
+
+
+def find_regressions(results: Dict, history: list, threshold: float = 1.25) -> Dict:
+    """
+    Compare results with the most recent stored measurement of each case.
+
+    Args:
+        results: Current mapping of case name to measurements
+        history: Previous runs, oldest first (as returned by load_history())
+        threshold: Slowdown ratio that counts as a regression
+
+    Returns:
+        Mapping of case name to (slowdown ratio, baseline commit) for
+        regressed cases
+    """
+    regressions = {}
+    for name, current in results.items():
+        previous = next((run for run in reversed(history) if name in run['results']), None)
+        if previous is None or not previous['results'][name]['median']:
+            continue
+        ratio = current['median'] / previous['results'][name]['median']
+        if ratio > threshold:
+            regressions[name] = (ratio, previous.get('commit'))
+    return regressions
+
+
+def format_result(name: str, result: Dict) -> str:
+    """Format one result as a report line."""
+    line = (f"{name:<45} {result['median'] * 1000:>10.3f} ms "
+            f"(min {result['min'] * 1000:.3f}) {result['peak_kb']:>12.1f} KB")
+    if 'per_item' in result:
+        line += f" {result['per_item'] * 1e6:>10.3f} µs/item"
+    return line
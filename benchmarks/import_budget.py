@@ -0,0 +1,102 @@
+"""
+Import Budget Check
+Enforce a startup-time budget for the utils package using ``python -X importtime``.
+
+Usage (from the repository root):
+    python -m benchmarks.import_budget
+    python -m benchmarks.import_budget --budget-ms 20
+
+Exits with status 1 if importing the utils modules takes longer than the
+budget or pulls in any of the heavy scraping dependencies.
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+MODULES = ('utils', 'utils.config', 'utils.helpers', 'utils.validators', 'utils.streaming',
+           'utils.sitemaps', 'utils.tables', 'utils.profiling',
+           'utils.snapshots', 'utils.batch')
+
+# Heavy dependencies that must only be imported on first use
+HEAVY_MODULES = ('requests', 'lxml', 'bs4', 'selenium', 'webdriver_manager', 'pandas', 'scrapy')
+
+IMPORT_BUDGET_MS = 25.0
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| ( *)(\S+)$')
+
+
+def measure_imports(modules=MODULES) -> tuple:
+    """
+    Import modules in a fresh interpreter with -X importtime.
+
+    Args:
+        modules: Module names to import
+
+    Returns:
+        Tuple of (total milliseconds spent in the top-level imports of
+        modules, set of every module name imported along the way)
+    """
+    code = '; '.join(f'import {name}' for name in modules)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, check=True,
+                            cwd=Path(__file__).parent.parent)
+
+    total_us = 0
+    imported = set()
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        _, cumulative, indent, name = match.groups()
+        imported.add(name)
+        if not indent and name.split('.')[0] == 'utils':
+            total_us += int(cumulative)
+    return total_us / 1000, imported
+
+
+def check(budget_ms: float = IMPORT_BUDGET_MS, runs: int = 5) -> list:
+    """
+    Check the import budget, taking the fastest of several runs.
+
+    Args:
+        budget_ms: Maximum allowed import time in milliseconds
+        runs: Number of fresh interpreters to try
+
+    Returns:
+        List of problems (empty if the budget is met)
+    """
+    samples = [measure_imports() for _ in range(runs)]
+    best_ms = min(total for total, _ in samples)
+    imported = set().union(*(names for _, names in samples))
+
+    problems = []
+    if best_ms > budget_ms:
+        problems.append(f"import time {best_ms:.1f} ms exceeds budget of {budget_ms:.1f} ms")
+    heavy = sorted({name.split('.')[0] for name in imported} & set(HEAVY_MODULES))
+    if heavy:
+        problems.append(f"heavy modules imported eagerly: {', '.join(heavy)}")
+
+    print(f"utils import time: {best_ms:.1f} ms (budget {budget_ms:.1f} ms)")
+    return problems
+
+
+def main():
+    """Run the check and exit non-zero on failure."""
+    parser = argparse.ArgumentParser(description='Check the utils import-time budget.')
+    parser.add_argument('--budget-ms', type=float, default=IMPORT_BUDGET_MS)
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    problems = check(args.budget_ms, args.runs)
+    for problem in problems:
+        print(f"✗ {problem}")
+    if problems:
+        sys.exit(1)
+    print("✓ Import budget met")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Crawl Load Test
+Run the tutorial's crawlers against the local mock site and report
+throughput, latency percentiles and memory.
+
+Usage (from the repository root):
+    python -m benchmarks.load_test                      # all targets
+    python -m benchmarks.load_test --target spider --latency 0.05 --download-delay 0
+    python -m benchmarks.load_test --target respectful --crawl-delay 1
+
+Each target runs in its own subprocess when --target all is used, so peak
+memory figures are not shared and Scrapy's reactor starts fresh.
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+from .mock_site import MockSite, MockSiteConfig
+
+MODULES_DIR = Path(__file__).parent.parent / 'modules'
+ROBOTS_EXAMPLE = MODULES_DIR / '05_best_practices' / 'examples' / '01_robots_txt.py'
+LINKS_EXAMPLE = MODULES_DIR / '01_introduction' / 'examples' / '03_extract_links.py'
+SCRAPY_PROJECT = MODULES_DIR / '04_scrapy' / 'project_template'
+
+TARGETS = ('respectful', 'links', 'spider')
+
+
+def load_example(path: Path):
+    """Import an example script by path (their names start with digits)."""
+    spec = importlib.util.spec_from_file_location(path.stem.lstrip('0123456789_'), path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def peak_rss_kb() -> float:
+    """Peak resident set size of this process in KB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / 1024 if sys.platform == 'darwin' else peak
+
+
+def summarize(target: str, latencies: list, elapsed: float, site: MockSite) -> dict:
+    """Build a report from per-page latencies."""
+    report = {
+        'target': target,
+        'pages': len(latencies),
+        'elapsed': round(elapsed, 3),
+        'pages_per_sec': round(len(latencies) / elapsed, 2) if elapsed else 0.0,
+        'peak_rss_kb': peak_rss_kb(),
+        'server': {str(key): count for key, count in site.stats.items()},
+    }
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100, method='inclusive')
+        report.update(p50=cuts[49], p90=cuts[89], p99=cuts[98])
+    elif latencies:
+        report.update(p50=latencies[0], p90=latencies[0], p99=latencies[0])
+    return report
+
+
+def time_calls(func, urls) -> tuple:
+    """Call func(url) for each URL with output silenced; return latencies and elapsed time."""
+    latencies = []
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for url in urls:
+            call_start = time.perf_counter()
+            func(url)
+            latencies.append(time.perf_counter() - call_start)
+    return latencies, time.perf_counter() - start
+
+
+def run_respectful(site: MockSite, args) -> dict:
+    """RespectfulScraper.scrape() over every quotes page (includes its politeness delays)."""
+    scraper = load_example(ROBOTS_EXAMPLE).RespectfulScraper(user_agent='LoadTest')
+    urls = [f'{site.url}/page/{n}/' for n in range(1, site.config.quote_pages + 1)]
+    latencies, elapsed = time_calls(scraper.scrape, urls)
+    return summarize('respectful', latencies, elapsed, site)
+
+
+def run_links(site: MockSite, args) -> dict:
+    """extract_links() over every product catalog page."""
+    extract_links = load_example(LINKS_EXAMPLE).extract_links
+    urls = [f'{site.url}/products/page/{n}/' for n in range(1, site.config.product_pages + 1)]
+    latencies, elapsed = time_calls(extract_links, urls)
+    return summarize('links', latencies, elapsed, site)
+
+
+def run_spider(site: MockSite, args) -> dict:
+    """Crawl the quotes site with ExampleSpider and the project settings."""
+    sys.path.insert(0, str(SCRAPY_PROJECT))
+    os.environ.setdefault('SCRAPY_SETTINGS_MODULE', 'tutorial_scrapy.settings')
+    from scrapy import signals
+    from scrapy.crawler import CrawlerProcess
+    from scrapy.utils.project import get_project_settings
+    from tutorial_scrapy.spiders.example_spider import ExampleSpider
+
+    settings = get_project_settings()
+    settings.set('LOG_LEVEL', 'WARNING')
+    if args.download_delay is not None:
+        settings.set('DOWNLOAD_DELAY', args.download_delay)
+    if args.concurrency is not None:
+        settings.set('CONCURRENT_REQUESTS', args.concurrency)
+
+    latencies = []
+
+    def response_received(response, request, spider):
+        if 'download_latency' in request.meta and not response.url.endswith('/robots.txt'):
+            latencies.append(request.meta['download_latency'])
+
+    process = CrawlerProcess(settings)
+    crawler = process.create_crawler(ExampleSpider)
+    crawler.signals.connect(response_received, signal=signals.response_received)
+    process.crawl(crawler, start_urls=[f'{site.url}/'],
+                  allowed_domains=[site.server.server_address[0]])
+    start = time.perf_counter()
+    process.start()
+    return summarize('spider', latencies, time.perf_counter() - start, site)
+
+
+RUNNERS = {
+    'respectful': run_respectful,
+    'links': run_links,
+    'spider': run_spider,
+}
+
+
+def format_report(report: dict) -> str:
+    """Format a report for the console."""
+    lines = [f"\n{report['target']}",
+             f"  Pages:        {report['pages']} in {report['elapsed']:.2f}s "
+             f"({report['pages_per_sec']} pages/sec)"]
+    if 'p50' in report:
+        lines.append(f"  Latency:      p50 {report['p50'] * 1000:.1f} ms, "
+                     f"p90 {report['p90'] * 1000:.1f} ms, p99 {report['p99'] * 1000:.1f} ms")
+    lines.append(f"  Peak RSS:     {report['peak_rss_kb'] / 1024:.1f} MB")
+    lines.append(f"  Server:       {report['server']}")
+    return '\n'.join(lines)
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Load test crawlers against the mock site.')
+    parser.add_argument('--target', choices=TARGETS + ('all',), default='all')
+    parser.add_argument('--quote-pages', type=int, default=10)
+    parser.add_argument('--product-pages', type=int, default=10)
+    parser.add_argument('--products-per-page', type=int, default=20)
+    parser.add_argument('--crawl-delay', type=int, default=0, help='robots.txt Crawl-delay')
+    parser.add_argument('--latency', type=float, default=0.0, help='Server latency in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random latency')
+    parser.add_argument('--rate-429', type=float, default=0.0, help='Fraction of 429 responses')
+    parser.add_argument('--download-delay', type=float, default=None,
+                        help='Override Scrapy DOWNLOAD_DELAY')
+    parser.add_argument('--concurrency', type=int, default=None,
+                        help='Override Scrapy CONCURRENT_REQUESTS')
+    parser.add_argument('--json', action='store_true', help='Print reports as JSON')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the selected load test(s)."""
+    argv = sys.argv[1:] if argv is None else argv
+    args = parse_args(argv)
+
+    if args.target == 'all':
+        reports = []
+        for target in TARGETS:
+            cmd = [sys.executable, '-m', 'benchmarks.load_test', *argv,
+                   '--target', target, '--json']
+            out = subprocess.run(cmd, capture_output=True, text=True,
+                                 cwd=Path(__file__).parent.parent)
+            if out.returncode != 0:
+                print(f"✗ {target} failed:\n{out.stderr.strip()}")
+                continue
+            reports.extend(json.loads(out.stdout.strip().splitlines()[-1]))
+    else:
+        config = MockSiteConfig(quote_pages=args.quote_pages, product_pages=args.product_pages,
+                                products_per_page=args.products_per_page,
+                                crawl_delay=args.crawl_delay, latency=args.latency,
+                                jitter=args.jitter, rate_429=args.rate_429)
+        with MockSite(config) as site:
+            reports = [RUNNERS[args.target](site, args)]
+
+    if args.json:
+        print(json.dumps(reports))
+    else:
+        for report in reports:
+            print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Mock Site
+A local, configurable web server for offline crawl load tests.
+
+Serves a paginated quotes site (same markup as quotes.toscrape.com), a
+paginated product catalog built from the sample page, robots.txt with a
+Crawl-delay, and an oversized page, with optional latency and 429s.
+
+Usage (from the repository root):
+    python -m benchmarks.mock_site --port 8000 --latency 0.05
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from collections import Counter
+from dataclasses import dataclass
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from .synthetic import generate_catalog
+
+QUOTE_PAGE = re.compile(r'^/(?:page/(\d+)/)?$')
+PRODUCT_PAGE = re.compile(r'^/products/(?:page/(\d+)/)?$')
+
+AUTHORS = ['Albert Einstein', 'Jane Austen', 'Mark Twain', 'Marilyn Monroe']
+TAGS = ['life', 'love', 'humor', 'inspirational', 'books', 'truth']
+
+
+@dataclass
+class MockSiteConfig:
+    """Shape and behaviour of the mock site."""
+
+    quote_pages: int = 10
+    quotes_per_page: int = 10
+    product_pages: int = 10
+    products_per_page: int = 20
+    large_page_products: int = 10000
+    crawl_delay: int = 0
+    latency: float = 0.0
+    jitter: float = 0.0
+    rate_429: float = 0.0
+    seed: int = 0
+
+
+def render_quotes_page(page: int, config: MockSiteConfig) -> str:
+    """Render one quotes.toscrape.com-style page."""
+    quotes = []
+    for i in range(config.quotes_per_page):
+        n = (page - 1) * config.quotes_per_page + i
+        tags = ''.join(f'<a class="tag" href="/tag/{tag}/">{tag}</a>'
+                       for tag in TAGS[n % 3:n % 3 + 3])
+        quotes.append(
+            f'<div class="quote">'
+            f'<span class="text">"Quote number {n}."</span>'
+            f'<span>by <small class="author">{escape(AUTHORS[n % len(AUTHORS)])}</small></span>'
+            f'<div class="tags">{tags}</div>'
+            f'</div>'
+        )
+    pager = ''
+    if page > 1:
+        pager += f'<li class="previous"><a href="/page/{page - 1}/">Previous</a></li>'
+    if page < config.quote_pages:
+        pager += f'<li class="next"><a href="/page/{page + 1}/">Next</a></li>'
+    return (f'<!DOCTYPE html><html><head><title>Quotes - page {page}</title></head>'
+            f'<body><div class="container">{"".join(quotes)}'
+            f'<nav><ul class="pager">{pager}</ul></nav></div></body></html>')
+
+
+def render_products_page(page: int, config: MockSiteConfig) -> str:
+    """Render one catalog page with pagination links."""
+    html = generate_catalog(config.products_per_page)
+    if page < config.product_pages:
+        html = html.replace(
+            '</main>',
+            f'<ul class="pager"><li class="next"><a href="/products/page/{page + 1}/">Next</a></li></ul></main>',
+        )
+    return html
+
+
+def render_robots(config: MockSiteConfig) -> str:
+    """Render robots.txt."""
+    lines = ['User-agent: *', 'Disallow: /private/']
+    if config.crawl_delay:
+        lines.append(f'Crawl-delay: {config.crawl_delay}')
+    return '\n'.join(lines) + '\n'
+
+
+class MockSiteHandler(BaseHTTPRequestHandler):
+    """Request handler; the server carries the config and stats."""
+
+    def do_GET(self):
+        server = self.server
+        server.record('requests')
+
+        delay = server.config.latency + server.random.uniform(0, server.config.jitter)
+        if delay:
+            time.sleep(delay)
+
+        if self.path != '/robots.txt' and server.random.random() < server.config.rate_429:
+            return self.respond(429, 'Too Many Requests', extra_headers={'Retry-After': '1'})
+
+        status, body, content_type = self.route(self.path.split('?', 1)[0])
+        self.respond(status, body, content_type)
+
+    def route(self, path):
+        """Map a path to (status, body, content type)."""
+        config = self.server.config
+        if path == '/robots.txt':
+            return 200, render_robots(config), 'text/plain'
+        if path == '/large/':
+            return 200, generate_catalog(config.large_page_products), 'text/html'
+
+        match = QUOTE_PAGE.match(path)
+        if match:
+            page = int(match.group(1) or 1)
+            if 1 <= page <= config.quote_pages:
+                return 200, render_quotes_page(page, config), 'text/html'
+
+        match = PRODUCT_PAGE.match(path)
+        if match:
+            page = int(match.group(1) or 1)
+            if 1 <= page <= config.product_pages:
+                return 200, render_products_page(page, config), 'text/html'
+
+        return 404, 'Not Found', 'text/plain'
+
+    def respond(self, status, body, content_type='text/plain', extra_headers=None):
+        """Send a complete response; clients hanging up early are only counted."""
+        self.server.record(status)
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (extra_headers or {}).items():
+            self.send_header(name, value)
+        try:
+            self.end_headers()
+            self.wfile.write(data)
+        except (BrokenPipeError, ConnectionResetError):
+            # Streaming clients close the connection once they have enough
+            self.server.record('aborted')
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        """Keep load-test output quiet."""
+
+
+class MockSite:
+    """
+    Run the mock site in a background thread.
+
+    Example:
+        with MockSite(MockSiteConfig(latency=0.05)) as site:
+            requests.get(site.url + '/page/1/')
+            print(site.stats)
+    """
+
+    def __init__(self, config: MockSiteConfig = None, host: str = '127.0.0.1', port: int = 0):
+        self.config = config or MockSiteConfig()
+        self.server = ThreadingHTTPServer((host, port), MockSiteHandler)
+        self.server.daemon_threads = True
+        self.server.config = self.config
+        self.server.random = random.Random(self.config.seed)
+        self.server.stats = Counter()
+        self._lock = threading.Lock()
+        self.server.record = self._record
+        self._thread = None
+
+    def _record(self, key):
+        with self._lock:
+            self.server.stats[key] += 1
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running site."""
+        host, port = self.server.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def stats(self) -> Counter:
+        """Request and status-code counters."""
+        with self._lock:
+            return Counter(self.server.stats)
+
+    def reset_stats(self):
+        """Clear the counters."""
+        with self._lock:
+            self.server.stats.clear()
+
+    def start(self):
+        """Start serving in a daemon thread."""
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving."""
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Serve the mock site until interrupted."""
+    parser = argparse.ArgumentParser(description='Serve the mock scraping site.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8000)
+    parser.add_argument('--quote-pages', type=int, default=10)
+    parser.add_argument('--product-pages', type=int, default=10)
+    parser.add_argument('--crawl-delay', type=int, default=0)
+    parser.add_argument('--latency', type=float, default=0.0)
+    parser.add_argument('--jitter', type=float, default=0.0)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    args = parser.parse_args()
+
+    config = MockSiteConfig(quote_pages=args.quote_pages, product_pages=args.product_pages,
+                            crawl_delay=args.crawl_delay, latency=args.latency,
+                            jitter=args.jitter, rate_429=args.rate_429)
+    site = MockSite(config, args.host, args.port)
+    print(f"✓ Serving mock site at {site.url} (Ctrl+C to stop)")
+    try:
+        site.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        site.server.server_close()
+
+
+if __name__ == "__main__":
+    main()
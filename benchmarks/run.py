@@ -0,0 +1,74 @@
+"""
+Benchmark Runner
+Run every benchmark suite, compare with the last stored run and save results.
+
+Usage (from the repository root):
+    python -m benchmarks.run
+    python -m benchmarks.run --sizes 10,1000 --filter parse
+    python -m benchmarks.run --suite validators
+    python -m benchmarks.run --fail-on-regression
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from . import bench_parsing, bench_pipeline, bench_validators
+from .harness import HISTORY_FILE, find_regressions, format_result, load_history, measure, save_run
+
+SUITES = {
+    'parsing': bench_parsing,
+    'pipeline': bench_pipeline,
+    'validators': bench_validators,
+}
+DEFAULT_SIZES = '10,100,1000,10000,100000'
+
+
+def parse_args(argv=None):
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description='Run scraping benchmarks.')
+    parser.add_argument('--sizes', default=DEFAULT_SIZES,
+                        help=f'Comma-separated product counts (default: {DEFAULT_SIZES})')
+    parser.add_argument('--repeat', type=int, default=5, help='Timed samples per case')
+    parser.add_argument('--suite', action='append', choices=sorted(SUITES),
+                        help='Only run these suites (repeatable; default: all)')
+    parser.add_argument('--filter', default='', help='Only run cases whose name contains this')
+    parser.add_argument('--history', type=Path, default=HISTORY_FILE, help='History file')
+    parser.add_argument('--no-save', action='store_true', help='Do not record this run')
+    parser.add_argument('--threshold', type=float, default=1.25,
+                        help='Slowdown ratio reported as a regression')
+    parser.add_argument('--fail-on-regression', action='store_true',
+                        help='Exit with status 1 if any case regressed')
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    """Run the benchmarks and report results."""
+    args = parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+
+    results = {}
+    for suite_name in args.suite or SUITES:
+        # Cases are (name, callable) or (name, callable, items per call)
+        for name, func, *items in SUITES[suite_name].cases(sizes):
+            if args.filter not in name:
+                continue
+            results[name] = measure(func, repeat=args.repeat, items=items[0] if items else None)
+            print(format_result(name, results[name]))
+
+    history = load_history(args.history)
+    regressions = find_regressions(results, history, args.threshold)
+    if regressions:
+        print(f"\n⚠ {len(regressions)} regression(s):")
+        for name, (ratio, commit) in sorted(regressions.items()):
+            print(f"  - {name}: {ratio:.2f}x slower than {commit}")
+
+    if not args.no_save:
+        save_run(results, args.history)
+        print(f"\n✓ Results saved to {args.history}")
+
+    return 1 if regressions and args.fail_on_regression else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
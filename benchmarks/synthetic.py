@@ -0,0 +1,51 @@
+"""
+Synthetic Pages
+Scale data/sample_pages/sample_products.html up to any number of products.
+"""
+
+import itertools
+import re
+from functools import lru_cache
+from pathlib import Path
+
+SAMPLE_PAGE = Path(__file__).parent.parent / 'data' / 'sample_pages' / 'sample_products.html'
+
+PRODUCT_PATTERN = re.compile(r'<div class="product" data-id="(\d+)">.*?</div>', re.DOTALL)
+ROW_PATTERN = re.compile(r'<tr>\s*<td>.*?</tr>', re.DOTALL)
+
+
+def _replace_span(text: str, matches, replacement: str) -> str:
+    """Replace everything from the first to the last match with replacement."""
+    return text[:matches[0].start()] + replacement + text[matches[-1].end():]
+
+
+@lru_cache(maxsize=2)
+def generate_catalog(n_products: int, sample_path: Path = SAMPLE_PAGE) -> str:
+    """
+    Build a product page with n_products product blocks and table rows.
+
+    The sample's product blocks and comparison table rows are repeated
+    in order, with data-id and product links renumbered so every block
+    is unique.
+
+    Args:
+        n_products: Number of products to generate
+        sample_path: Page to use as a template
+
+    Returns:
+        HTML document as a string
+    """
+    html = sample_path.read_text(encoding='utf-8')
+
+    products = list(PRODUCT_PATTERN.finditer(html))
+    blocks = []
+    for i, match in zip(range(n_products), itertools.cycle(products)):
+        product_id = str(1000 + i)
+        old_id = match.group(1)
+        block = match.group(0).replace(f'data-id="{old_id}"', f'data-id="{product_id}"')
+        blocks.append(block.replace(f'/product/{old_id}"', f'/product/{product_id}"'))
+    html = _replace_span(html, products, '\n\n        '.join(blocks))
+
+    rows = list(ROW_PATTERN.finditer(html))
+    cycled = itertools.islice(itertools.cycle(m.group(0) for m in rows), n_products)
+    return _replace_span(html, rows, '\n                '.join(cycled))
@@ -0,0 +1,77 @@
+"""
+Example: Caching Rendered Pages
+Render pages with Selenium once, then re-run extraction offline against
+the cached DOM with BeautifulSoup.
+"""
+
+import sys
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+# Make the repository's utils package importable when run from this folder
+sys.path.insert(0, str(Path(__file__).resolve().parents[3]))
+
+from utils.config import HEADLESS_MODE, SELENIUM_PAGE_LOAD_TIMEOUT
+from utils.snapshots import SnapshotCache
+
+# Anything that changes the rendered DOM belongs here: it's part of the cache key
+RENDER_CONFIG = {
+    'browser': 'chrome',
+    'headless': HEADLESS_MODE,
+    'wait_for': 'body',
+}
+
+
+def render_pages(urls):
+    """Render URLs with Selenium, skipping those already in the cache."""
+    cache = SnapshotCache()
+    missing = [url for url in urls if cache.get(url, RENDER_CONFIG) is None]
+    if not missing:
+        print("✓ All pages cached, no browser needed")
+        return
+
+    # Import Selenium only when something actually needs rendering
+    from selenium import webdriver
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.webdriver.chrome.service import Service
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    options = webdriver.ChromeOptions()
+    if RENDER_CONFIG['headless']:
+        options.add_argument('--headless=new')
+    service = Service(ChromeDriverManager().install())
+    driver = webdriver.Chrome(service=service, options=options)
+    driver.set_page_load_timeout(SELENIUM_PAGE_LOAD_TIMEOUT)
+
+    def render(url):
+        driver.get(url)
+        WebDriverWait(driver, 10).until(
+            EC.presence_of_element_located((By.TAG_NAME, RENDER_CONFIG['wait_for']))
+        )
+        return driver.page_source
+
+    try:
+        for url in missing:
+            print(f"Rendering {url}...")
+            cache.get_or_render(url, render, RENDER_CONFIG, refresh=True)
+    finally:
+        driver.quit()
+
+
+def extract_offline():
+    """Run the extractor over every cached snapshot - no browser involved."""
+    cache = SnapshotCache()
+    for url, page_source in cache.iter_snapshots(RENDER_CONFIG):
+        soup = BeautifulSoup(page_source, 'lxml')
+        heading = soup.find('h1')
+        links = soup.find_all('a', href=True)
+        print(f"{url}: {heading.get_text().strip() if heading else '[no h1]'} "
+              f"({len(links)} links)")
+
+
+if __name__ == "__main__":
+    render_pages(["https://example.com"])
+    extract_offline()
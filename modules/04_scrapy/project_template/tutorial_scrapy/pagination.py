@@ -0,0 +1,121 @@
+"""
+Pagination Helpers
+Speculatively schedule upcoming pages of predictable /page/N/ listings.
+"""
+
+import re
+from typing import List, Optional
+
+PAGE_PATTERN = re.compile(r'/page/(\d+)/?')
+
+
+def page_number(url: str) -> Optional[int]:
+    """
+    Extract the page number from a /page/N/ URL.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        Page number, or None if the URL doesn't follow the pattern
+    """
+    match = PAGE_PATTERN.search(url)
+    return int(match.group(1)) if match else None
+
+
+def listing_key(url: str) -> str:
+    """
+    Identify the listing a /page/N/ URL belongs to.
+
+    Args:
+        url: Page URL
+
+    Returns:
+        The URL with its page segment removed, e.g. '/tag/love/page/3/'
+        and '/tag/love/page/7/' both give '/tag/love/'
+    """
+    return PAGE_PATTERN.sub('/', url, count=1)
+
+
+def page_url(url: str, number: int) -> str:
+    """
+    Build the URL of another page from a /page/N/ URL.
+
+    Args:
+        url: A URL that follows the pattern
+        number: Page number to substitute
+
+    Returns:
+        URL of the requested page
+    """
+    match = PAGE_PATTERN.search(url)
+    start, end = match.span(1)
+    return url[:start] + str(number) + url[end:]
+
+
+class PagePrefetcher:
+    """
+    Keep a window of upcoming pages scheduled ahead of the parser.
+
+    Instead of waiting for each page's "next" link before requesting the
+    following page, the next ``window`` pages are requested at once so
+    they download in parallel. Once a page turns out to be empty or
+    missing, the end of the listing is recorded and nothing past it is
+    scheduled.
+
+    State is kept per listing (see listing_key()), so a spider can
+    paginate several /page/N/ listings of the same site independently.
+    """
+
+    def __init__(self, window: int = 4):
+        self.window = window
+        self.highest_scheduled = {}
+        self.last_page = {}
+
+    def urls_from(self, url: str) -> List[str]:
+        """
+        Return not-yet-scheduled page URLs from url's page up to the window.
+
+        Args:
+            url: URL of the next page in the listing
+
+        Returns:
+            Page URLs to request (empty if url doesn't follow the pattern)
+        """
+        first = page_number(url)
+        if first is None:
+            return []
+
+        key = listing_key(url)
+        last = first + max(self.window, 1) - 1
+        if key in self.last_page:
+            last = min(last, self.last_page[key])
+
+        highest = self.highest_scheduled.get(key, 0)
+        start = max(first, highest + 1)
+        self.highest_scheduled[key] = max(highest, last)
+        return [page_url(url, number) for number in range(start, last + 1)]
+
+    def mark_end(self, url: str, inclusive: bool = False):
+        """
+        Record where the listing ends.
+
+        Args:
+            url: URL of the page that revealed the end
+            inclusive: True if url is itself the last page (it had content
+                but no next link), False if it was empty or missing
+        """
+        number = page_number(url)
+        if number is None:
+            return
+        key = listing_key(url)
+        last = number if inclusive else number - 1
+        self.last_page[key] = min(self.last_page.get(key, last), last)
+
+    def is_past_end(self, url: str) -> bool:
+        """Check whether url lies beyond the recorded end of the listing."""
+        number = page_number(url)
+        if number is None:
+            return False
+        last = self.last_page.get(listing_key(url))
+        return last is not None and number > last
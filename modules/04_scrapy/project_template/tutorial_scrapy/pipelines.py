@@ -6,10 +6,18 @@ Process scraped items here.
 from datetime import datetime
 from itemadapter import ItemAdapter
 
+try:
+    # Time pipelines as the 'pipeline' stage when the tutorial's utils are importable
+    from utils.profiling import instrument
+except ImportError:
+    def instrument(name):
+        return lambda func: func
+
 
 class CleanDataPipeline:
     """Clean and validate scraped data."""
     
+    @instrument('pipeline')
     def process_item(self, item, spider):
         adapter = ItemAdapter(item)
         
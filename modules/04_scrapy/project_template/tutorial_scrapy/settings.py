@@ -20,6 +20,9 @@ CONCURRENT_REQUESTS = 16
 # Configure a delay for requests
 DOWNLOAD_DELAY = 2
 
+# Number of /page/N/ listing pages to request ahead of the parser
+PAGINATION_PREFETCH = 4
+
 # Disable cookies (enabled by default)
 #COOKIES_ENABLED = False
 
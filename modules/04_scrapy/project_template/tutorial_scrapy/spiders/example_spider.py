@@ -5,6 +5,7 @@ A basic Scrapy spider to demonstrate structure.
 
 import scrapy
 from tutorial_scrapy.items import ProductItem
+from tutorial_scrapy.pagination import PagePrefetcher, page_number
 
 
 class ExampleSpider(scrapy.Spider):
@@ -14,11 +15,27 @@ class ExampleSpider(scrapy.Spider):
     allowed_domains = ['quotes.toscrape.com']
     start_urls = ['http://quotes.toscrape.com/']
     
+    @classmethod
+    def from_crawler(cls, crawler, *args, **kwargs):
+        """Create the spider with a prefetcher sized from the settings."""
+        spider = super().from_crawler(crawler, *args, **kwargs)
+        spider.prefetcher = PagePrefetcher(crawler.settings.getint('PAGINATION_PREFETCH', 4))
+        return spider
+    
     def parse(self, response):
         """Parse the main page and extract quotes."""
         
+        quotes = response.css('div.quote')
+        
+        # An empty or missing page marks the end of the listing
+        if response.status == 404 or not quotes:
+            self.prefetcher.mark_end(response.url)
+            return
+        if self.prefetcher.is_past_end(response.url):
+            return
+        
         # Extract quotes
-        for quote in response.css('div.quote'):
+        for quote in quotes:
             yield {
                 'text': quote.css('span.text::text').get(),
                 'author': quote.css('small.author::text').get(),
@@ -27,5 +44,15 @@ class ExampleSpider(scrapy.Spider):
         
         # Follow pagination
         next_page = response.css('li.next a::attr(href)').get()
-        if next_page:
+        if not next_page:
+            self.prefetcher.mark_end(response.url, inclusive=True)
+            return
+        
+        # Schedule the next few /page/N/ pages at once so they download in
+        # parallel; other URL shapes are followed one page at a time
+        next_url = response.urljoin(next_page)
+        if page_number(next_url) is None:
             yield response.follow(next_page, self.parse)
+            return
+        for url in self.prefetcher.urls_from(next_url):
+            yield scrapy.Request(url, self.parse, meta={'handle_httpstatus_list': [404]})
@@ -17,8 +17,8 @@ class RespectfulScraper:
         self.user_agent = user_agent
         self.robot_parsers = {}
     
-    def can_fetch(self, url):
-        """Check if URL can be fetched according to robots.txt"""
+    def get_robot_parser(self, url):
+        """Get the (cached) robots.txt parser for a URL's site, or None"""
         
         # Parse URL to get base
         parsed = urlparse(url)
@@ -36,21 +36,41 @@ class RespectfulScraper:
                 print(f"✓ Loaded robots.txt from {robots_url}")
             except Exception as e:
                 print(f"⚠ Could not load robots.txt: {e}")
-                # If can't load, assume it's OK (be conservative)
-                return True
+                return None
+        
+        return self.robot_parsers[base_url]
+    
+    def can_fetch(self, url):
+        """Check if URL can be fetched according to robots.txt"""
+        
+        rp = self.get_robot_parser(url)
+        if rp is None:
+            # If can't load, assume it's OK (be conservative)
+            return True
         
         # Check if we can fetch
-        can_fetch = self.robot_parsers[base_url].can_fetch(self.user_agent, url)
+        can_fetch = rp.can_fetch(self.user_agent, url)
         
         if can_fetch:
             # Check crawl delay
-            crawl_delay = self.robot_parsers[base_url].crawl_delay(self.user_agent)
+            crawl_delay = rp.crawl_delay(self.user_agent)
             if crawl_delay:
                 print(f"  Respecting crawl delay: {crawl_delay}s")
                 time.sleep(crawl_delay)
         
         return can_fetch
     
+    def sitemaps(self, url):
+        """List the sitemaps declared in robots.txt (or the default location)"""
+        
+        rp = self.get_robot_parser(url)
+        declared = rp.site_maps() if rp else None
+        if declared:
+            return declared
+        
+        parsed = urlparse(url)
+        return [f"{parsed.scheme}://{parsed.netloc}/sitemap.xml"]
+    
     def scrape(self, url):
         """Scrape URL if allowed by robots.txt"""
         
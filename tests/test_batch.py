@@ -0,0 +1,193 @@
+"""Tests for utils.batch."""
+
+import concurrent.futures
+import gzip
+import json
+import sys
+import threading
+import time
+import zlib
+from pathlib import Path
+
+import pytest
+
+from utils import batch
+from utils.batch import (
+    decode_http_body,
+    iter_warc_records,
+    process_archive,
+)
+
+SAMPLE_PAGE = Path(__file__).parent.parent / 'data' / 'sample_pages' / 'sample_products.html'
+SAMPLE = SAMPLE_PAGE.read_bytes()
+PRODUCTS_PER_PAGE = 3
+
+
+def warc_record(warc_type, uri, block):
+    head = (f'WARC/1.0\r\nWARC-Type: {warc_type}\r\nWARC-Target-URI: {uri}\r\n'
+            f'Content-Length: {len(block)}\r\n\r\n').encode('latin-1')
+    return head + block + b'\r\n\r\n'
+
+
+def http_response(body, content_type='text/html', **headers):
+    lines = ['HTTP/1.1 200 OK', f'Content-Type: {content_type}']
+    lines += [f"{name.replace('_', '-')}: {value}" for name, value in headers.items()]
+    return ('\r\n'.join(lines) + '\r\n\r\n').encode('latin-1') + body
+
+
+def chunked(body, size=1000):
+    parts = [b'%x\r\n%s\r\n' % (len(body[i:i + size]), body[i:i + size])
+             for i in range(0, len(body), size)]
+    return b''.join(parts) + b'0\r\n\r\n'
+
+
+RECORDS = [
+    ('warcinfo', '', b'software: test\r\n'),
+    ('request', 'http://shop.test/plain', b'GET /plain HTTP/1.1\r\nHost: shop.test\r\n\r\n'),
+    ('response', 'http://shop.test/plain', http_response(SAMPLE)),
+    ('response', 'http://shop.test/gzip', http_response(gzip.compress(SAMPLE), Content_Encoding='gzip')),
+    ('response', 'http://shop.test/chunked-gzip',
+     http_response(chunked(gzip.compress(SAMPLE)), Content_Encoding='gzip', Transfer_Encoding='chunked')),
+    ('response', 'http://shop.test/image.png', http_response(b'\x89PNG', content_type='image/png')),
+    ('response', 'http://shop.test/broken', http_response(b'not gzip at all', Content_Encoding='gzip')),
+]
+
+
+def write_warc(path, compress):
+    records = [warc_record(*record) for record in RECORDS]
+    if compress:
+        # One gzip member per record, as WARC writers do
+        path.write_bytes(b''.join(gzip.compress(record) for record in records))
+    else:
+        path.write_bytes(b''.join(records))
+    return path
+
+
+@pytest.fixture
+def pages_dir(tmp_path):
+    root = tmp_path / 'pages'
+    (root / 'a').mkdir(parents=True)
+    (root / 'b').mkdir()
+    (root / 'a' / 'one.html').write_bytes(SAMPLE)
+    (root / 'b' / 'two.htm').write_bytes(SAMPLE)
+    (root / 'b' / 'notes.txt').write_text('not a page')
+    (root / 'b' / 'huge.html').write_bytes(SAMPLE * 20)
+    return root
+
+
+def run(source, **kwargs):
+    return {source: (data, error) for source, data, error in
+            process_archive(source, workers=2, **kwargs)}
+
+
+def test_process_directory_skips_oversized_files(pages_dir):
+    results = run(pages_dir, max_bytes=len(SAMPLE) * 2)
+
+    assert sorted(Path(source).name for source in results) == ['huge.html', 'one.html', 'two.htm']
+    for source, (data, error) in results.items():
+        if source.endswith('huge.html'):
+            assert data is None and error == 'skipped: too large'
+        else:
+            assert error is None
+            assert len(data) == PRODUCTS_PER_PAGE
+            assert data[0]['source'] == source
+
+
+@pytest.mark.parametrize('name, compress', [('crawl.warc', False), ('crawl.warc.gz', True)])
+def test_process_warc(tmp_path, name, compress):
+    results = run(write_warc(tmp_path / name, compress))
+
+    assert set(results) == {'http://shop.test/plain', 'http://shop.test/gzip',
+                            'http://shop.test/chunked-gzip', 'http://shop.test/broken'}
+    for uri in ('http://shop.test/plain', 'http://shop.test/gzip', 'http://shop.test/chunked-gzip'):
+        data, error = results[uri]
+        assert error is None
+        assert [item['source'] for item in data] == [uri] * PRODUCTS_PER_PAGE
+
+    data, error = results['http://shop.test/broken']
+    assert data is None
+    assert error.startswith('undecodable body: invalid gzip body')
+
+
+def test_warc_max_bytes_skips_large_records(tmp_path):
+    path = write_warc(tmp_path / 'crawl.warc', compress=False)
+    uris = [uri for uri, _, _ in iter_warc_records(path, max_bytes=len(SAMPLE) // 2)]
+
+    # Only the compressed records are small enough, and they decode past the cap
+    assert 'http://shop.test/plain' not in uris
+    assert 'http://shop.test/gzip' in uris
+    assert all(error for _, body, error in iter_warc_records(path, max_bytes=len(SAMPLE) // 2))
+
+
+@pytest.mark.parametrize('headers, body', [
+    ({}, SAMPLE),
+    ({'content-encoding': 'gzip'}, gzip.compress(SAMPLE)),
+    ({'content-encoding': 'x-gzip'}, gzip.compress(SAMPLE)),
+    ({'content-encoding': 'deflate'}, zlib.compress(SAMPLE)),
+    ({'content-encoding': 'deflate'}, zlib.compress(SAMPLE)[2:-4]),
+    ({'transfer-encoding': 'chunked'}, chunked(SAMPLE)),
+    # Already de-chunked by the WARC writer
+    ({'transfer-encoding': 'chunked'}, SAMPLE),
+    ({'transfer-encoding': 'chunked', 'content-encoding': 'gzip'}, chunked(gzip.compress(SAMPLE))),
+])
+def test_decode_http_body(headers, body):
+    assert decode_http_body(headers, body) == SAMPLE
+
+
+@pytest.mark.parametrize('headers, body', [
+    ({'content-encoding': 'br'}, b'...'),
+    ({'content-encoding': 'gzip'}, b'plain text'),
+    ({'content-encoding': 'gzip'}, gzip.compress(SAMPLE)[:100]),
+])
+def test_decode_http_body_errors(headers, body):
+    with pytest.raises(ValueError):
+        decode_http_body(headers, body)
+
+
+class TrackingExecutor(concurrent.futures.ThreadPoolExecutor):
+    """Thread pool that records how many futures are outstanding at each submit."""
+
+    outstanding = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def __init__(self, max_workers=None):
+        super().__init__(max_workers=max_workers)
+
+    def submit(self, fn, *args, **kwargs):
+        with self.lock:
+            TrackingExecutor.outstanding += 1
+            TrackingExecutor.peak = max(TrackingExecutor.peak, TrackingExecutor.outstanding)
+        return super().submit(fn, *args, **kwargs)
+
+
+def slow_extract(source, html):
+    time.sleep(0.01)
+    return {'source': source}
+
+
+def test_process_archive_bounds_in_flight_pages(tmp_path, monkeypatch):
+    for i in range(40):
+        (tmp_path / f'{i:02}.html').write_bytes(b'<html></html>')
+    monkeypatch.setattr(concurrent.futures, 'ProcessPoolExecutor', TrackingExecutor)
+    TrackingExecutor.outstanding = TrackingExecutor.peak = 0
+
+    results = []
+    for result in process_archive(tmp_path, extract=slow_extract, workers=2, max_in_flight=5):
+        # A future leaves the in-flight set once its result has been handed out
+        TrackingExecutor.outstanding -= 1
+        results.append(result)
+
+    assert len(results) == 40
+    assert TrackingExecutor.peak == 5
+
+
+def test_cli_writes_json_lines(pages_dir, tmp_path, monkeypatch, capsys):
+    output = tmp_path / 'out' / 'products.jsonl'
+    monkeypatch.setattr(sys, 'argv', ['batch', str(pages_dir), str(output), '--workers', '1',
+                                      '--max-bytes', str(len(SAMPLE) * 2)])
+    batch.main()
+
+    records = [json.loads(line) for line in output.read_text(encoding='utf-8').splitlines()]
+    assert len(records) == 2 * PRODUCTS_PER_PAGE
+    assert '3 pages processed, 6 records written' in capsys.readouterr().out
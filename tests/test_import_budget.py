@@ -0,0 +1,7 @@
+"""Enforce the utils import-time budget (see benchmarks/import_budget.py)."""
+
+from benchmarks.import_budget import check
+
+
+def test_utils_import_budget():
+    assert check() == []
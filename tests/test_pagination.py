@@ -0,0 +1,70 @@
+"""Tests for the Scrapy template's PagePrefetcher."""
+
+import sys
+from pathlib import Path
+
+SCRAPY_PROJECT = Path(__file__).parent.parent / 'modules' / '04_scrapy' / 'project_template'
+if str(SCRAPY_PROJECT) not in sys.path:
+    sys.path.insert(0, str(SCRAPY_PROJECT))
+
+from tutorial_scrapy.pagination import PagePrefetcher, listing_key  # noqa: E402
+
+BASE = 'http://quotes.example.com'
+
+
+def page(n, listing=''):
+    return f'{BASE}{listing}/page/{n}/'
+
+
+def test_listing_key_drops_page_segment():
+    assert listing_key(page(3, '/tag/love')) == listing_key(page(7, '/tag/love'))
+    assert listing_key(page(3, '/tag/love')) != listing_key(page(3))
+
+
+def test_window_schedules_each_page_once():
+    prefetcher = PagePrefetcher(window=3)
+
+    assert prefetcher.urls_from(page(2)) == [page(2), page(3), page(4)]
+    assert prefetcher.urls_from(page(3)) == [page(5)]
+    assert prefetcher.urls_from(page(3)) == []
+    assert prefetcher.urls_from(f'{BASE}/catalogue/') == []
+
+
+def test_mark_end_exclusive_clamps_after_missing_page():
+    prefetcher = PagePrefetcher(window=4)
+    prefetcher.urls_from(page(2))
+
+    # page 4 was a 404 or empty, so page 3 is the last one
+    prefetcher.mark_end(page(4))
+
+    assert prefetcher.is_past_end(page(5))
+    assert not prefetcher.is_past_end(page(3))
+    assert prefetcher.urls_from(page(3)) == []
+
+
+def test_mark_end_inclusive():
+    prefetcher = PagePrefetcher(window=2)
+    prefetcher.mark_end(page(3), inclusive=True)
+
+    assert not prefetcher.is_past_end(page(3))
+    assert prefetcher.is_past_end(page(4))
+    assert prefetcher.urls_from(page(2)) == [page(2), page(3)]
+
+
+def test_mark_end_keeps_earliest_end():
+    prefetcher = PagePrefetcher()
+    prefetcher.mark_end(page(6))
+    prefetcher.mark_end(page(9))
+
+    assert prefetcher.is_past_end(page(6))
+
+
+def test_listings_are_tracked_separately():
+    prefetcher = PagePrefetcher(window=3)
+    prefetcher.urls_from(page(2))
+    prefetcher.mark_end(page(3), inclusive=True)
+
+    assert prefetcher.urls_from(page(2, '/tag/love')) == [
+        page(2, '/tag/love'), page(3, '/tag/love'), page(4, '/tag/love')]
+    assert not prefetcher.is_past_end(page(4, '/tag/love'))
+    assert prefetcher.is_past_end(page(4))
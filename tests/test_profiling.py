@@ -0,0 +1,56 @@
+"""Tests for utils.profiling."""
+
+import time
+
+from utils.profiling import StageProfiler
+from utils.streaming import feed_until, stop_after_tag
+
+
+def test_only_slowest_pages_are_kept():
+    profiler = StageProfiler(enabled=True, slowest=3)
+    for i in range(1000):
+        with profiler.page(f'page-{i}'):
+            profiler.record('fetch', i / 1000)
+
+    assert profiler.page_count == 1000
+    assert len(profiler._slow_timings) == 3
+    assert profiler.summary()['fetch']['count'] == 1000
+
+
+def test_slowest_pages_are_ordered_by_total():
+    profiler = StageProfiler(enabled=True, slowest=2)
+    for key, delay in [('fast', 0.0), ('slow', 0.02), ('medium', 0.01)]:
+        with profiler.page(key):
+            with profiler.stage('fetch'):
+                time.sleep(delay)
+
+    slow = profiler.slowest_pages()
+    assert [key for key, _ in slow] == ['slow', 'medium']
+    assert set(slow[0][1]) == {'fetch', 'total'}
+
+
+def test_feed_until_records_parse_stage(monkeypatch):
+    from utils import streaming
+
+    profiler = StageProfiler(enabled=True)
+    monkeypatch.setattr(streaming, 'profiler', profiler)
+
+    root = feed_until([b'<html><head><title>T</title></head>', b'<body></body></html>'],
+                      until=stop_after_tag('head'))
+
+    assert root.findtext('.//title') == 'T'
+    assert profiler.summary()['parse']['count'] == 1
+
+
+def test_equal_slow_pages_with_profiles_do_not_compare_profiles(monkeypatch, tmp_path):
+    from utils import profiling
+
+    # Every page takes exactly the same time
+    monkeypatch.setattr(profiling.time, 'perf_counter', lambda: 0.0)
+    profiler = StageProfiler(enabled=True, mode='cprofile', slowest=2)
+    for _ in range(4):
+        with profiler.page('same'):
+            pass
+
+    assert len(profiler._slow_pages) == 2
+    assert len(profiler.dump(tmp_path)) == 3
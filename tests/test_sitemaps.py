@@ -0,0 +1,92 @@
+"""Tests for utils.sitemaps."""
+
+import gzip
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from utils.sitemaps import SitemapEntry, discover_urls, fetch_sitemap
+
+URLSET = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <url><loc>https://example.com/a</loc><lastmod>2024-01-01</lastmod></url>
+  <url><loc>https://example.com/b</loc></url>
+</urlset>"""
+
+# path: (body, extra headers)
+ROUTES = {
+    '/sitemap.xml': (URLSET, {}),
+    '/sitemap.xml.gz': (gzip.compress(URLSET), {}),
+    '/encoded.xml.gz': (gzip.compress(gzip.compress(URLSET)), {'Content-Encoding': 'gzip'}),
+    '/encoded.xml': (gzip.compress(URLSET), {'Content-Encoding': 'gzip'}),
+    '/empty.xml': (b'', {}),
+    '/blank.xml': (b'  \n', {}),
+    '/garbage.xml': (b'\x00\x01 not xml', {}),
+    '/truncated.xml.gz': (gzip.compress(URLSET)[:40], {}),
+}
+
+
+class SitemapHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path not in ROUTES:
+            self.send_error(404)
+            return
+        body, headers = ROUTES[self.path]
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/xml')
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope='module')
+def base_url():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SitemapHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.parametrize('path', ['/sitemap.xml', '/sitemap.xml.gz',
+                                  '/encoded.xml.gz', '/encoded.xml'])
+def test_fetch_sitemap_plain_and_gzipped(base_url, path):
+    entries = list(fetch_sitemap(base_url + path))
+
+    assert [entry.loc for entry in entries] == ['https://example.com/a', 'https://example.com/b']
+    assert entries[0].lastmod == datetime(2024, 1, 1, tzinfo=timezone.utc)
+    assert entries[1].lastmod is None
+
+
+@pytest.mark.parametrize('path', ['/empty.xml', '/blank.xml', '/garbage.xml',
+                                  '/truncated.xml.gz', '/missing.xml'])
+def test_fetch_sitemap_bad_body_yields_nothing(base_url, path):
+    assert list(fetch_sitemap(base_url + path)) == []
+
+
+def test_discover_urls_skips_stale_indexes_and_survives_bad_sitemaps(base_url):
+    since = datetime(2024, 6, 1, tzinfo=timezone.utc)
+    index = [
+        SitemapEntry(base_url + '/old.xml', datetime(2024, 1, 1, tzinfo=timezone.utc), True),
+        SitemapEntry(base_url + '/empty.xml', None, True),
+        SitemapEntry(base_url + '/sitemap.xml', datetime(2024, 7, 1, tzinfo=timezone.utc), True),
+    ]
+    fetched = []
+
+    def fetch(url):
+        fetched.append(url)
+        return index if url == 'index' else fetch_sitemap(url)
+
+    urls = [entry.loc for entry in discover_urls(['index'], since=since, fetch=fetch)]
+
+    assert base_url + '/old.xml' not in fetched
+    assert base_url + '/empty.xml' in fetched
+    # /a is older than since, /b has no lastmod
+    assert urls == ['https://example.com/b']
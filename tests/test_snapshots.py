@@ -0,0 +1,106 @@
+"""Tests for utils.snapshots."""
+
+import gzip
+import json
+import os
+import threading
+import time
+
+from utils.snapshots import SnapshotCache
+
+URL = 'https://example.com/product/1'
+HEADLESS = {'browser': 'chrome', 'headless': True}
+
+
+def age(path, seconds):
+    """Backdate a snapshot's modification time."""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+
+def test_put_and_get_round_trip(tmp_path):
+    cache = SnapshotCache(tmp_path, ttl=60)
+    path = cache.put(URL, '<html>1</html>', HEADLESS)
+
+    assert path.exists()
+    assert cache.get(URL, HEADLESS) == '<html>1</html>'
+    assert list(tmp_path.glob('*/*.tmp')) == []
+
+
+def test_missing_and_expired_snapshots_are_misses(tmp_path):
+    cache = SnapshotCache(tmp_path, ttl=60)
+    assert cache.get(URL) is None
+
+    age(cache.put(URL, '<html></html>'), 120)
+    assert cache.get(URL) is None
+    assert SnapshotCache(tmp_path, ttl=None).get(URL) == '<html></html>'
+
+
+def test_render_config_is_part_of_the_key(tmp_path):
+    cache = SnapshotCache(tmp_path)
+    cache.put(URL, 'headless', HEADLESS)
+    cache.put(URL, 'headful', {'browser': 'chrome', 'headless': False})
+
+    assert cache.get(URL, HEADLESS) == 'headless'
+    assert cache.get(URL, {'headless': True, 'browser': 'chrome'}) == 'headless'
+    assert cache.get(URL) is None
+    assert list(cache.iter_snapshots(HEADLESS)) == [(URL, 'headless')]
+    assert len(list(cache.iter_snapshots())) == 2
+
+
+def test_get_or_render_renders_once(tmp_path):
+    cache = SnapshotCache(tmp_path)
+    calls = []
+
+    def render(url):
+        calls.append(url)
+        return f'<html>{len(calls)}</html>'
+
+    assert cache.get_or_render(URL, render) == '<html>1</html>'
+    assert cache.get_or_render(URL, render) == '<html>1</html>'
+    assert cache.get_or_render(URL, render, refresh=True) == '<html>2</html>'
+    assert calls == [URL, URL]
+
+
+def test_purge_expired(tmp_path):
+    cache = SnapshotCache(tmp_path, ttl=60)
+    age(cache.put('https://example.com/old', 'old'), 120)
+    cache.put('https://example.com/new', 'new')
+
+    assert cache.purge_expired() == 1
+    assert [url for url, _ in cache.iter_snapshots()] == ['https://example.com/new']
+    assert [url for url, _ in cache.iter_snapshots(include_expired=True)] == ['https://example.com/new']
+
+
+def test_iter_snapshots_skips_incomplete_records(tmp_path):
+    cache = SnapshotCache(tmp_path)
+    cache.put(URL, 'ok')
+    broken = cache.path_for('https://example.com/broken')
+    broken.parent.mkdir(parents=True, exist_ok=True)
+    with gzip.open(broken, 'wt', encoding='utf-8') as f:
+        json.dump({'url': 'https://example.com/broken'}, f)
+
+    assert list(cache.iter_snapshots()) == [(URL, 'ok')]
+    assert cache.get('https://example.com/broken') is None
+
+
+def test_concurrent_writers_of_the_same_url(tmp_path):
+    cache = SnapshotCache(tmp_path)
+    errors = []
+
+    def write(n):
+        try:
+            for _ in range(20):
+                cache.put(URL, f'<html>{n}</html>' * 1000)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert cache.get(URL) in {f'<html>{n}</html>' * 1000 for n in range(4)}
+    assert list(tmp_path.glob('*/*.tmp')) == []
@@ -0,0 +1,53 @@
+"""Tests for utils.streaming against the local mock site."""
+
+import time
+
+import pytest
+
+from benchmarks.mock_site import MockSite, MockSiteConfig
+from utils.streaming import fetch_streaming, stop_after_tag, stream_parse
+
+MAX_BYTES = 64 * 1024
+
+
+@pytest.fixture(scope='module')
+def site():
+    with MockSite(MockSiteConfig(large_page_products=2000)) as site:
+        yield site
+
+
+def test_fetch_streaming_rejects_oversized_page(site):
+    assert fetch_streaming(site.url + '/large/', max_bytes=MAX_BYTES) is None
+
+
+def test_stream_parse_without_stop_condition_rejects_oversized_page(site):
+    assert stream_parse(site.url + '/large/', max_bytes=MAX_BYTES) is None
+
+
+def test_stream_parse_stops_early_on_oversized_page(site):
+    root = stream_parse(site.url + '/large/', until=stop_after_tag('head'),
+                        max_bytes=MAX_BYTES, chunk_size=4096)
+
+    assert root is not None
+    assert root.findtext('.//title')
+    # Only the start of the page was parsed
+    assert len(root.xpath('//div[@data-id]')) < 2000
+
+
+def test_mock_site_counts_aborted_responses():
+    # The default large page is bigger than the loopback socket buffers
+    with MockSite() as site:
+        stream_parse(site.url + '/large/', until=stop_after_tag('head'), max_bytes=MAX_BYTES)
+
+        # The server notices the hang-up asynchronously
+        for _ in range(100):
+            if site.stats['aborted']:
+                break
+            time.sleep(0.05)
+        assert site.stats['aborted'] == 1
+
+
+def test_stream_parse_aborts_when_stop_condition_never_fires(site):
+    root = stream_parse(site.url + '/large/', until=stop_after_tag('footer-never'),
+                        max_bytes=MAX_BYTES)
+    assert root is None
@@ -0,0 +1,61 @@
+"""Tests for utils.tables."""
+
+import pytest
+
+from utils.tables import coerce_column, read_table, read_tables, read_tables_batched
+
+TABLE = '<table><tr><th>name</th><th>price</th></tr><tr><td>A</td><td>$1,299.99</td></tr></table>'
+
+
+def test_read_table_coerces_prices():
+    assert read_table(TABLE) == {'name': ['A'], 'price': [1299.99]}
+
+
+@pytest.mark.parametrize('html', ['', '   \n', b'', b'\n'])
+def test_read_tables_empty_document(html):
+    assert read_tables(html) == []
+
+
+def test_read_tables_str_with_encoding_declaration():
+    html = f'<?xml version="1.0" encoding="iso-8859-1"?><html><body>{TABLE}</body></html>'
+    assert read_tables(html) == [{'name': ['A'], 'price': [1299.99]}]
+
+
+def test_read_tables_batched_skips_empty_pages():
+    pages = [('u1', TABLE), ('u2', ''), ('u3', TABLE)]
+    batches = list(read_tables_batched(pages, batch_size=10))
+
+    assert batches == [{'source': ['u1', 'u3'], 'name': ['A', 'A'], 'price': [1299.99, 1299.99]}]
+
+
+def test_read_tables_batched_keeps_table_column_named_like_source_column():
+    html = '<table><tr><th>source</th><th>source_1</th></tr><tr><td>z</td><td>y</td></tr></table>'
+    batches = list(read_tables_batched([('u1', html)]))
+
+    assert batches == [{'source': ['u1'], 'source_2': ['z'], 'source_1': ['y']}]
+
+
+@pytest.mark.parametrize('headers, expected', [
+    (['a_1', 'a', 'a'], ['a_1', 'a', 'a_2']),
+    (['a', 'a', 'a_1'], ['a', 'a_2', 'a_1']),
+    (['', 'column_1'], ['column_1_1', 'column_1']),
+    (['x', '', 'column_2'], ['x', 'column_2_1', 'column_2']),
+])
+def test_header_suffixes_never_collide(headers, expected):
+    header_row = ''.join(f'<th>{header}</th>' for header in headers)
+    cells = ''.join(f'<td>{i}</td>' for i in range(len(headers)))
+    columns = read_table(f'<table><tr>{header_row}</tr><tr>{cells}</tr></table>')
+
+    assert list(columns) == expected
+    assert sorted(value for values in columns.values() for value in values) == \
+        [float(i) for i in range(len(headers))]
+
+
+@pytest.mark.parametrize('values', [['nan', 'inf'], ['Infinity', '1'], ['1e5', '2'], ['1_000', '3']])
+def test_non_decimal_numbers_are_not_coerced(values):
+    assert coerce_column(values) == values
+
+
+def test_coerce_column_accepts_prices():
+    assert coerce_column(['$1,299.99', ' 12 ', '-3.5', '.5', None, '']) == \
+        [1299.99, 12.0, -3.5, 0.5, None, None]
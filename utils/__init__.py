@@ -1,19 +1,42 @@
-"""Utils package for web scraping utilities."""
+"""Utils package for web scraping utilities.
 
-from .helpers import (
-    rate_limit,
-    get_headers,
-    clean_text,
-    safe_find,
-    safe_get_text,
-    save_to_file
-)
+Helpers are imported on first attribute access so that ``import utils``
+stays cheap for short-lived worker processes.
+"""
+
+import importlib
+
+_LAZY_ATTRIBUTES = {
+    'rate_limit': 'helpers',
+    'get_headers': 'helpers',
+    'clean_text': 'helpers',
+    'clean_price': 'helpers',
+    'make_soup': 'helpers',
+    'safe_find': 'helpers',
+    'safe_get_text': 'helpers',
+    'save_to_file': 'helpers',
+}
 
 __all__ = [
     'rate_limit',
     'get_headers',
     'clean_text',
+    'clean_price',
+    'make_soup',
     'safe_find',
     'safe_get_text',
     'save_to_file'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        module = importlib.import_module(f'.{_LAZY_ATTRIBUTES[name]}', __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,379 @@
+"""
+Batch Processing of Saved Pages
+Re-run extraction over a directory of saved HTML files or a WARC archive,
+fanned out across a process pool with a bounded number of pages in flight,
+writing results to a JSON-lines file as they complete.
+
+Usage (from the repository root):
+    python -m utils.batch data/sample_pages products.jsonl
+    python -m utils.batch crawl.warc.gz out.jsonl --workers 8 --extractor mypkg.extract:parse_page
+
+An extractor is a module-level function ``extract(source, html)`` taking
+the page's path or URL and its raw bytes, and returning a dict, a list of
+dicts, or None.
+"""
+
+import argparse
+import gzip
+import importlib
+import json
+import os
+import zlib
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple, Union
+
+from .config import MAX_RESPONSE_BYTES
+from .helpers import clean_price, clean_text
+
+HTML_PATTERNS = ('*.html', '*.htm')
+
+
+def iter_html_files(directory: Union[str, Path], patterns=HTML_PATTERNS) -> Iterator[Path]:
+    """
+    Walk a directory tree for saved HTML files.
+
+    Args:
+        directory: Root directory
+        patterns: Glob patterns to match
+
+    Yields:
+        File paths, in sorted order per directory
+    """
+    for root, dirs, files in os.walk(directory):
+        dirs.sort()
+        for name in sorted(files):
+            path = Path(root) / name
+            if any(path.match(pattern) for pattern in patterns):
+                yield path
+
+
+def _read_warc_headers(stream) -> Optional[dict]:
+    """Read one block of 'Name: value' header lines; None at end of file."""
+    line = stream.readline()
+    while line in (b'\r\n', b'\n'):
+        line = stream.readline()
+    if not line:
+        return None
+
+    headers = {'_first_line': line.strip().decode('latin-1')}
+    for line in iter(stream.readline, b''):
+        if line in (b'\r\n', b'\n'):
+            break
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _parse_http_headers(block: bytes) -> dict:
+    """Parse the header block of a recorded HTTP response (status line skipped)."""
+    headers = {}
+    for line in block.splitlines()[1:]:
+        name, _, value = line.decode('latin-1').partition(':')
+        headers[name.strip().lower()] = value.strip()
+    return headers
+
+
+def _dechunk(body: bytes) -> Optional[bytes]:
+    """Undo chunked transfer encoding; None if body isn't validly chunked."""
+    chunks = []
+    position = 0
+    while True:
+        line_end = body.find(b'\n', position)
+        if line_end < 0:
+            return None
+        try:
+            size = int(body[position:line_end].split(b';', 1)[0].strip(), 16)
+        except ValueError:
+            return None
+        position = line_end + 1
+        if size == 0:
+            return b''.join(chunks)
+        if position + size > len(body):
+            return None
+        chunks.append(body[position:position + size])
+        position = body.find(b'\n', position + size) + 1
+        if position == 0:
+            return None
+
+
+def _decompress(body: bytes, encoding: str, max_bytes: int) -> bytes:
+    """Undo one gzip or deflate content coding, capped at max_bytes of output."""
+    if encoding in ('gzip', 'x-gzip'):
+        attempts = (16 + zlib.MAX_WBITS,)
+    elif encoding == 'deflate':
+        # Servers send both zlib-wrapped and raw deflate streams
+        attempts = (zlib.MAX_WBITS, -zlib.MAX_WBITS)
+    else:
+        raise ValueError(f"unsupported Content-Encoding '{encoding}'")
+
+    for wbits in attempts:
+        decompressor = zlib.decompressobj(wbits)
+        try:
+            data = decompressor.decompress(body, max_bytes + 1)
+        except zlib.error as e:
+            error = e
+            continue
+        if len(data) > max_bytes:
+            raise ValueError(f"decoded body exceeds {max_bytes} bytes")
+        if not decompressor.eof:
+            raise ValueError(f"truncated {encoding} body")
+        return data
+    raise ValueError(f"invalid {encoding} body: {error}")
+
+
+def decode_http_body(http_headers: dict, body: bytes, max_bytes: int = MAX_RESPONSE_BYTES) -> bytes:
+    """
+    Undo the transfer and content codings of a recorded HTTP response body.
+
+    Bodies marked as chunked that aren't actually chunked (some WARC
+    writers de-chunk but keep the header) are used as they are.
+
+    Args:
+        http_headers: Lower-cased HTTP response headers
+        body: Body bytes as stored in the WARC record
+        max_bytes: Maximum decoded size
+
+    Returns:
+        Decoded body bytes
+
+    Raises:
+        ValueError: If the body can't be decoded or decodes past max_bytes
+    """
+    if 'chunked' in http_headers.get('transfer-encoding', '').lower():
+        dechunked = _dechunk(body)
+        if dechunked is not None:
+            body = dechunked
+
+    encodings = [encoding.strip().lower()
+                 for encoding in http_headers.get('content-encoding', '').split(',')]
+    for encoding in reversed(encodings):
+        if encoding and encoding != 'identity':
+            body = _decompress(body, encoding, max_bytes)
+    return body
+
+
+def iter_warc_records(path: Union[str, Path], max_bytes: int = MAX_RESPONSE_BYTES
+                      ) -> Iterator[Tuple[str, Optional[bytes], Optional[str]]]:
+    """
+    Stream HTML responses out of a WARC (or .warc.gz) file, one record at a time.
+
+    Chunked and gzip/deflate-encoded bodies are decoded.
+
+    Args:
+        path: WARC file path
+        max_bytes: Records with larger payloads (stored or decoded) are skipped
+
+    Yields:
+        (target URI, HTTP body bytes, None) for each HTML 'response' record,
+        or (target URI, None, error message) if its body can't be decoded
+    """
+    opener = gzip.open if str(path).endswith('.gz') else open
+    with opener(path, 'rb') as stream:
+        while True:
+            headers = _read_warc_headers(stream)
+            if headers is None:
+                return
+            length = int(headers.get('content-length', 0))
+            if headers.get('warc-type') != 'response' or length > max_bytes:
+                stream.seek(length, os.SEEK_CUR)
+                continue
+
+            block = stream.read(length)
+            head, _, body = block.partition(b'\r\n\r\n')
+            if b'text/html' not in head.lower() and b'xhtml' not in head.lower():
+                continue
+            uri = headers.get('warc-target-uri', '')
+            try:
+                yield uri, decode_http_body(_parse_http_headers(head), body, max_bytes), None
+            except ValueError as e:
+                yield uri, None, f'undecodable body: {e}'
+
+
+def read_page(path: Union[str, Path], max_bytes: int = MAX_RESPONSE_BYTES) -> Optional[bytes]:
+    """
+    Read a saved page, skipping files larger than max_bytes.
+
+    Args:
+        path: File path
+        max_bytes: Maximum file size to read
+
+    Returns:
+        File contents, or None if the file is too large
+    """
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size > max_bytes:
+            return None
+        return f.read()
+
+
+def extract_products(source: str, html: bytes) -> list:
+    """
+    Default extractor for pages shaped like data/sample_pages/sample_products.html.
+
+    Args:
+        source: Page path or URL
+        html: Raw page bytes
+
+    Returns:
+        List of product dicts
+    """
+    from lxml import html as lxml_html
+
+    document = lxml_html.fromstring(html)
+    products = []
+    for product in document.xpath('//div[contains(concat(" ", @class, " "), " product ")]'):
+        def field(name):
+            nodes = product.xpath(f'.//*[contains(concat(" ", @class, " "), " {name} ")]')
+            return clean_text(nodes[0].text_content()) if nodes else ''
+
+        products.append({
+            'source': source,
+            'id': product.get('data-id'),
+            'title': field('product-title'),
+            'price': clean_price(field('price')),
+            'stock': field('stock'),
+        })
+    return products
+
+
+def resolve_extractor(spec: Union[str, Callable]) -> Callable:
+    """
+    Resolve an extractor given as a callable or a 'module:function' string.
+
+    Args:
+        spec: Callable or import path
+
+    Returns:
+        The extractor function
+    """
+    if callable(spec):
+        return spec
+    module_name, _, function_name = spec.partition(':')
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def _run_task(extract, task):
+    """Worker entry point: load the page if needed, then extract."""
+    kind, source, payload = task
+    if kind == 'error':
+        return source, None, payload
+    html = read_page(source, payload) if kind == 'file' else payload
+    if html is None:
+        return source, None, 'skipped: too large'
+    try:
+        return source, resolve_extractor(extract)(source, html), None
+    except Exception as e:
+        return source, None, f'{type(e).__name__}: {e}'
+
+
+def iter_tasks(source: Union[str, Path], max_bytes: int = MAX_RESPONSE_BYTES):
+    """
+    Turn a directory or WARC file into worker tasks.
+
+    Files are passed to workers by path so page bytes never travel
+    through the pool; WARC records are read here one at a time. Records
+    that can't be decoded become 'error' tasks, reported by the worker.
+    """
+    source = Path(source)
+    if source.is_dir():
+        for path in iter_html_files(source):
+            yield 'file', str(path), max_bytes
+    elif '.warc' in source.name:
+        for uri, body, error in iter_warc_records(source, max_bytes):
+            if error:
+                yield 'error', uri, error
+            else:
+                yield 'record', uri, body
+    else:
+        yield 'file', str(source), max_bytes
+
+
+def process_archive(source: Union[str, Path], extract: Union[str, Callable] = extract_products,
+                    workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+                    max_bytes: int = MAX_RESPONSE_BYTES) -> Iterator[Tuple[str, object, Optional[str]]]:
+    """
+    Extract from every page of a directory or WARC file in parallel.
+
+    At most max_in_flight pages are queued or running at any time, so
+    memory stays bounded no matter how large the archive is. Results are
+    yielded in completion order.
+
+    Args:
+        source: Directory of saved pages, a WARC file, or a single file
+        extract: Module-level extractor function or 'module:function'
+        workers: Worker processes (defaults to the CPU count)
+        max_in_flight: Pages queued at once (defaults to 4x workers)
+        max_bytes: Pages larger than this are skipped
+
+    Yields:
+        (source, extracted data, error message or None) tuples
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 4
+    tasks = iter_tasks(source, max_bytes)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = set()
+        for task in tasks:
+            pending.add(pool.submit(_run_task, extract, task))
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+        for future in wait(pending).done:
+            yield future.result()
+
+
+class JsonLinesSink:
+    """Append extracted records to a JSON-lines file as they arrive."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self.records = 0
+
+    def __enter__(self):
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        return self
+
+    def write(self, data):
+        """Write a dict, or each dict of a list."""
+        for record in data if isinstance(data, list) else [data]:
+            self._file.write(json.dumps(record, ensure_ascii=False) + '\n')
+            self.records += 1
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+
+def main():
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description='Extract data from saved pages in parallel.')
+    parser.add_argument('source', help='Directory of HTML files or a WARC file')
+    parser.add_argument('output', help='JSON-lines output file')
+    parser.add_argument('--extractor', default='utils.batch:extract_products',
+                        help="Extractor as 'module:function'")
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--max-in-flight', type=int, default=None)
+    parser.add_argument('--max-bytes', type=int, default=MAX_RESPONSE_BYTES)
+    args = parser.parse_args()
+
+    pages = errors = 0
+    with JsonLinesSink(args.output) as sink:
+        for source, data, error in process_archive(args.source, args.extractor, args.workers,
+                                                   args.max_in_flight, args.max_bytes):
+            pages += 1
+            if error:
+                errors += 1
+                print(f"✗ {source}: {error}")
+            elif data:
+                sink.write(data)
+
+    print(f"✓ {pages} pages processed, {sink.records} records written to {args.output}"
+          f" ({errors} errors)")
+
+
+if __name__ == "__main__":
+    main()
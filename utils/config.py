@@ -12,15 +12,34 @@ DATA_DIR = BASE_DIR / 'data'
 OUTPUT_DIR = DATA_DIR / 'outputs'
 SAMPLE_PAGES_DIR = DATA_DIR / 'sample_pages'
 
-# Create directories if they don't exist
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-SAMPLE_PAGES_DIR.mkdir(parents=True, exist_ok=True)
+
+def ensure_directories():
+    """
+    Create the data directories if they don't exist.
+
+    Called by code that writes to them rather than at import time, so
+    importing this module has no filesystem side effects.
+    """
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    SAMPLE_PAGES_DIR.mkdir(parents=True, exist_ok=True)
+
 
 # Request settings
 DEFAULT_TIMEOUT = 30
 MAX_RETRIES = 3
 RETRY_DELAY = 2
 
+# Streaming fetch settings
+STREAM_CHUNK_SIZE = 16 * 1024
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+ALLOWED_CONTENT_TYPES = ('text/html', 'application/xhtml+xml')
+
+# Validation settings
+URL_PARSE_CACHE_SIZE = 65536
+
+# Sitemap settings
+SITEMAP_STATE_FILE = OUTPUT_DIR / 'sitemap_state.json'
+
 # Rate limiting
 MIN_REQUEST_DELAY = 1.0
 MAX_REQUEST_DELAY = 3.0
@@ -37,6 +56,10 @@ SELENIUM_IMPLICIT_WAIT = 10
 SELENIUM_PAGE_LOAD_TIMEOUT = 30
 HEADLESS_MODE = True
 
+# Rendered page snapshots (see utils/snapshots.py)
+SNAPSHOT_DIR = DATA_DIR / 'snapshots'
+SNAPSHOT_TTL = 24 * 60 * 60
+
 # Scrapy settings
 SCRAPY_USER_AGENT = 'Tutorial Scraper (+https://github.com/Jasonyou1995/web-scraping-tutorial)'
 SCRAPY_ROBOTSTXT_OBEY = True
@@ -46,3 +69,6 @@ SCRAPY_DOWNLOAD_DELAY = 2
 # Logging
 LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
 LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+
+# Profiling (see utils/profiling.py)
+PROFILE_STAGES = os.getenv('PROFILE_STAGES', '0') == '1'
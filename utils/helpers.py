@@ -3,11 +3,17 @@ Utility Helper Functions for Web Scraping
 Common functions used across different scraping projects.
 """
 
+import re
 import time
 import random
 from functools import wraps
 from typing import Optional, Dict
 
+from .profiling import instrument
+
+# Plain decimal numbers only; float() would also accept 'nan', 'inf', '1e5' and '1_000'
+NUMBER_PATTERN = re.compile(r'[+-]?(?:\d+(?:\.\d*)?|\.\d+)')
+
 def rate_limit(min_delay: float = 1.0, max_delay: float = 3.0):
     """
     Decorator to add rate limiting to functions.
@@ -49,6 +55,7 @@ def get_headers(custom_headers: Optional[Dict] = None) -> Dict:
     
     return headers
 
+@instrument('clean')
 def clean_text(text: str) -> str:
     """
     Clean extracted text by removing extra whitespace.
@@ -66,6 +73,46 @@ def clean_text(text: str) -> str:
     lines = [line.strip() for line in text.splitlines()]
     return ' '.join(filter(None, lines))
 
+def clean_price(text: str) -> Optional[float]:
+    """
+    Convert a price string such as '$1,299.99' to a float.
+    
+    Uses the same cleaning as the Scrapy CleanDataPipeline (strip '$' and
+    thousands separators), but returns None instead of 0.0 for values
+    that aren't numbers. Only plain decimals count: 'nan', 'inf' and
+    '1e5' give None, and leading zeros are dropped ('02134' -> 2134.0).
+    
+    Args:
+        text: Raw price text
+    
+    Returns:
+        Price as a float, or None if not numeric
+    """
+    if not text:
+        return None
+    
+    number = text.replace('$', '').replace(',', '').strip()
+    if not NUMBER_PATTERN.fullmatch(number):
+        return None
+    return float(number)
+
+@instrument('parse')
+def make_soup(html, parser: str = 'lxml'):
+    """
+    Parse HTML into a BeautifulSoup object.
+    
+    Args:
+        html: HTML string or bytes
+        parser: BeautifulSoup parser, e.g. 'lxml' or 'html.parser'
+    
+    Returns:
+        BeautifulSoup object
+    """
+    from bs4 import BeautifulSoup
+    
+    return BeautifulSoup(html, parser)
+
+@instrument('select')
 def safe_find(soup, *args, **kwargs):
     """
     Safely find an element, returning None if not found.
@@ -0,0 +1,329 @@
+"""
+Stage Profiling
+Opt-in timing of scraping stages (fetch, parse, select, clean, extract,
+pipeline) with per-page attribution and profiles of the slowest pages.
+Only the slowest pages are kept, so memory stays flat on long crawls.
+
+Disabled by default; enable with PROFILE_STAGES=1 in the environment or
+``profiler.enable()``. While disabled, the hooks cost one attribute check.
+
+Example:
+    from utils.helpers import make_soup
+    from utils.profiling import profiler
+
+    profiler.enable(mode='sample', slowest=5)
+    for url in urls:
+        with profiler.page(url):
+            with profiler.stage('fetch'):
+                html = requests.get(url).text
+            soup = make_soup(html)   # utils.helpers, timed as 'parse'
+            ...
+    print(profiler.report())
+    profiler.dump()
+"""
+
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Optional
+
+from .config import OUTPUT_DIR, PROFILE_STAGES, ensure_directories
+
+PROFILE_MODES = (None, 'cprofile', 'sample')
+
+
+class _Sampler:
+    """Sample one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{frame.f_lineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[';'.join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write(self, path: Path):
+        """Write collapsed stacks (flamegraph.pl / speedscope format)."""
+        with open(path, 'w', encoding='utf-8') as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+class StageProfiler:
+    """
+    Collect per-stage timings and profiles of the slowest pages.
+
+    Args:
+        enabled: Start enabled
+        mode: None (timings only), 'cprofile' or 'sample'
+        slowest: Number of slowest pages whose timings and profiles are kept
+        sample_interval: Seconds between stack samples in 'sample' mode
+    """
+
+    def __init__(self, enabled: bool = False, mode: Optional[str] = None,
+                 slowest: int = 5, sample_interval: float = 0.005):
+        self.enabled = enabled
+        self.configure(mode, slowest, sample_interval)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._profiling = False
+        self.reset()
+
+    def configure(self, mode: Optional[str] = None, slowest: int = 5,
+                  sample_interval: float = 0.005):
+        """Set the profiling mode and how many slow pages to keep."""
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"mode must be one of {PROFILE_MODES}, got {mode!r}")
+        self.mode = mode
+        self.slowest = slowest
+        self.sample_interval = sample_interval
+
+    def enable(self, mode: Optional[str] = None, slowest: int = 5,
+               sample_interval: float = 0.005):
+        """Turn on timing (and optionally profiling of slow pages)."""
+        self.configure(mode, slowest, sample_interval)
+        self.enabled = True
+
+    def disable(self):
+        """Turn off timing; collected data is kept."""
+        self.enabled = False
+
+    def reset(self):
+        """Discard collected timings and profiles."""
+        with self._lock:
+            self.stages = {}
+            self.page_count = 0
+            self._slow_timings = []
+            self._slow_pages = []
+
+    def record(self, name: str, elapsed: float):
+        """
+        Add a measured duration to a stage (and to the current page).
+
+        Args:
+            name: Stage name
+            elapsed: Duration in seconds
+        """
+        with self._lock:
+            count, total, worst = self.stages.get(name, (0, 0.0, 0.0))
+            self.stages[name] = (count + 1, total + elapsed, max(worst, elapsed))
+        timings = getattr(self._local, 'timings', None)
+        if timings is not None:
+            timings[name] = timings.get(name, 0.0) + elapsed
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Time a block of code as one stage.
+
+        Args:
+            name: Stage name, e.g. 'fetch', 'parse', 'select', 'pipeline'
+        """
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def instrument(self, name: str):
+        """
+        Decorator that times every call of a function as a stage.
+
+        Args:
+            name: Stage name
+        """
+        def decorator(func):
+            @wraps(func)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return func(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return wrapper
+        return decorator
+
+    def _start_profile(self):
+        """Start a profiler for the current page, if none is running."""
+        with self._lock:
+            if self.mode is None or self._profiling:
+                return None
+            self._profiling = True
+        if self.mode == 'cprofile':
+            import cProfile
+            profile = cProfile.Profile()
+            profile.enable()
+        else:
+            profile = _Sampler(threading.get_ident(), self.sample_interval)
+            profile.start()
+        return profile
+
+    def _stop_profile(self, profile, key: str, elapsed: float, number: int):
+        """Stop a page profiler and keep it if the page is among the slowest."""
+        import heapq
+
+        if isinstance(profile, _Sampler):
+            profile.stop()
+        else:
+            profile.disable()
+        with self._lock:
+            self._profiling = False
+            # The page number breaks ties so profile objects are never compared
+            entry = (elapsed, number, key, profile)
+            if len(self._slow_pages) < self.slowest:
+                heapq.heappush(self._slow_pages, entry)
+            elif elapsed > self._slow_pages[0][0]:
+                heapq.heapreplace(self._slow_pages, entry)
+
+    @contextmanager
+    def page(self, key: str):
+        """
+        Attribute the stages inside the block to one page (e.g. its URL).
+
+        Args:
+            key: Page identifier
+        """
+        import heapq
+
+        if not self.enabled:
+            yield
+            return
+        timings = self._local.timings = {}
+        profile = self._start_profile()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._local.timings = None
+            timings['total'] = elapsed
+            with self._lock:
+                self.page_count += 1
+                number = self.page_count
+                # The page number breaks ties so the timing dicts are never compared
+                entry = (elapsed, number, key, timings)
+                if len(self._slow_timings) < self.slowest:
+                    heapq.heappush(self._slow_timings, entry)
+                elif elapsed > self._slow_timings[0][0]:
+                    heapq.heapreplace(self._slow_timings, entry)
+            if profile is not None:
+                self._stop_profile(profile, key, elapsed, number)
+
+    def slowest_pages(self, n: Optional[int] = None) -> list:
+        """
+        Return the slowest pages by total time.
+
+        Only the configured number of slowest pages is kept, so n can't
+        usefully exceed it.
+
+        Args:
+            n: Number of pages (defaults to the configured slowest)
+
+        Returns:
+            List of (key, stage timings) tuples, slowest first
+        """
+        with self._lock:
+            entries = sorted(self._slow_timings, reverse=True)
+        return [(key, timings) for _, _, key, timings in entries[:n or self.slowest]]
+
+    def summary(self) -> dict:
+        """Stage statistics as a dict of {stage: {count, total, mean, max}}."""
+        with self._lock:
+            return {
+                name: {'count': count, 'total': total, 'mean': total / count, 'max': worst}
+                for name, (count, total, worst) in self.stages.items()
+            }
+
+    def report(self) -> str:
+        """Human-readable stage and slow-page report."""
+        lines = [f"{'Stage':<12} {'Calls':>8} {'Total (s)':>10} {'Mean (ms)':>10} {'Max (ms)':>10}"]
+        for name, stats in sorted(self.summary().items(), key=lambda item: -item[1]['total']):
+            lines.append(f"{name:<12} {stats['count']:>8} {stats['total']:>10.3f} "
+                         f"{stats['mean'] * 1000:>10.3f} {stats['max'] * 1000:>10.3f}")
+        slow = self.slowest_pages()
+        if slow:
+            lines.append(f"\nSlowest pages (of {self.page_count}):")
+            for key, timings in slow:
+                stages = ', '.join(f"{name} {seconds * 1000:.1f} ms"
+                                   for name, seconds in timings.items() if name != 'total')
+                lines.append(f"  {timings.get('total', 0.0) * 1000:8.1f} ms  {key}  ({stages})")
+        return '\n'.join(lines)
+
+    def dump(self, output_dir: Optional[Path] = None, prefix: str = 'profile') -> list:
+        """
+        Write the stage summary and slow-page profiles to disk.
+
+        cProfile profiles are written as .prof files (open with pstats or
+        snakeviz); sampled profiles as collapsed stacks in .folded files
+        (open with flamegraph.pl or speedscope).
+
+        Args:
+            output_dir: Destination directory (defaults to OUTPUT_DIR)
+            prefix: File name prefix
+
+        Returns:
+            List of written paths
+        """
+        import json
+        from .validators import sanitize_filename
+
+        if output_dir is None:
+            ensure_directories()
+            output_dir = OUTPUT_DIR
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        summary_path = output_dir / f'{prefix}_stages.json'
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            json.dump({'stages': self.summary(), 'slowest_pages': self.slowest_pages()},
+                      f, indent=2)
+        written = [summary_path]
+
+        with self._lock:
+            slow_pages = sorted(self._slow_pages, key=lambda entry: entry[0], reverse=True)
+        for rank, (_, _, key, profile) in enumerate(slow_pages, 1):
+            name = f'{prefix}_slow{rank}_{sanitize_filename(key)[:100]}'
+            if isinstance(profile, _Sampler):
+                path = output_dir / f'{name}.folded'
+                profile.write(path)
+            else:
+                path = output_dir / f'{name}.prof'
+                profile.dump_stats(str(path))
+            written.append(path)
+
+        print(f"✓ Profile written to {output_dir}")
+        return written
+
+
+# Shared profiler used by the instrumented helpers
+profiler = StageProfiler(enabled=PROFILE_STAGES)
+stage = profiler.stage
+instrument = profiler.instrument
+page = profiler.page
@@ -0,0 +1,227 @@
+"""
+Sitemap Discovery
+Stream-parse (gzipped) sitemaps and sitemap indexes with constant memory,
+and select only URLs modified since the last crawl.
+
+requests and lxml are imported on first use to keep worker startup fast.
+"""
+
+import gzip
+import io
+import json
+from collections import namedtuple
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from .config import DEFAULT_TIMEOUT, SITEMAP_STATE_FILE
+from .helpers import get_headers
+
+SitemapEntry = namedtuple('SitemapEntry', ['loc', 'lastmod', 'is_index'])
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def parse_lastmod(text: Optional[str]) -> Optional[datetime]:
+    """
+    Parse a W3C datetime from a <lastmod> element.
+
+    Accepts 'YYYY', 'YYYY-MM', 'YYYY-MM-DD' and full timestamps with a
+    'Z' or numeric UTC offset. Naive values are treated as UTC.
+
+    Args:
+        text: Raw lastmod text
+
+    Returns:
+        Timezone-aware datetime, or None if missing or malformed
+    """
+    if not text:
+        return None
+    text = text.strip()
+    if len(text) == 4:
+        text += '-01-01'
+    elif len(text) == 7:
+        text += '-01'
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    try:
+        value = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value
+
+
+def _local_name(tag) -> str:
+    """Strip the XML namespace from a tag name."""
+    return tag.rsplit('}', 1)[-1] if isinstance(tag, str) else ''
+
+
+def iter_sitemap(source) -> Iterator[SitemapEntry]:
+    """
+    Stream entries from a sitemap or sitemap index.
+
+    Elements are cleared as soon as they are read, so memory stays flat
+    regardless of file size. An empty or unparseable document ends the
+    iteration after any entries read so far.
+
+    Args:
+        source: File path or binary file-like object (already decompressed)
+
+    Yields:
+        SitemapEntry for each <url> or <sitemap> element
+    """
+    from lxml import etree
+
+    events = etree.iterparse(source, events=('end',), recover=True,
+                             resolve_entities=False, no_network=True)
+    while True:
+        try:
+            _, element = next(events)
+        except StopIteration:
+            return
+        except etree.XMLSyntaxError as e:
+            print(f"⚠ Unreadable sitemap content: {e}")
+            return
+
+        name = _local_name(element.tag)
+        if name not in ('url', 'sitemap'):
+            continue
+
+        loc = lastmod = None
+        for child in element:
+            child_name = _local_name(child.tag)
+            if child_name == 'loc' and child.text:
+                loc = child.text.strip()
+            elif child_name == 'lastmod':
+                lastmod = parse_lastmod(child.text)
+
+        # Free the element and everything parsed before it
+        element.clear()
+        parent = element.getparent()
+        if parent is not None:
+            while element.getprevious() is not None:
+                del parent[0]
+
+        if loc:
+            yield SitemapEntry(loc, lastmod, name == 'sitemap')
+
+
+def fetch_sitemap(url: str, timeout: float = DEFAULT_TIMEOUT,
+                  headers: Optional[dict] = None) -> Iterator[SitemapEntry]:
+    """
+    Download and stream-parse a sitemap, decompressing gzip files on the fly.
+
+    Compression is detected from the gzip magic bytes after any
+    Content-Encoding has been undone, so .xml.gz files served with
+    'Content-Encoding: gzip' are not decompressed twice.
+
+    Args:
+        url: Sitemap URL
+        timeout: Request timeout in seconds
+        headers: Optional custom headers merged into the defaults
+
+    Yields:
+        SitemapEntry for each entry; nothing if the download fails
+    """
+    import requests
+
+    try:
+        with requests.get(url, headers=get_headers(headers), timeout=timeout,
+                          stream=True) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            # Keep the raw stream readable at EOF for the buffered wrapper
+            response.raw.auto_close = False
+            stream = io.BufferedReader(response.raw)
+            if stream.peek(len(GZIP_MAGIC))[:len(GZIP_MAGIC)] == GZIP_MAGIC:
+                stream = gzip.GzipFile(fileobj=stream)
+            yield from iter_sitemap(stream)
+    except (requests.exceptions.RequestException, OSError, EOFError) as e:
+        print(f"✗ Error fetching sitemap {url}: {e}")
+
+
+def discover_urls(sitemap_urls: Iterable[str], since: Optional[datetime] = None,
+                  fetch=fetch_sitemap, max_depth: int = 3) -> Iterator[SitemapEntry]:
+    """
+    Walk sitemaps (following indexes) and yield pages changed since a time.
+
+    Child sitemaps whose own lastmod is older than ``since`` are skipped
+    without being downloaded. Entries without a lastmod are always
+    yielded, since we can't tell whether they changed.
+
+    Args:
+        sitemap_urls: Sitemap or sitemap index URLs
+        since: Time of the last crawl; None yields everything
+        fetch: Function mapping a sitemap URL to SitemapEntry objects
+        max_depth: Maximum nesting of sitemap indexes to follow
+
+    Yields:
+        SitemapEntry for each page URL to (re)crawl
+    """
+    if since is not None and since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+
+    def is_stale(entry):
+        return since is not None and entry.lastmod is not None and entry.lastmod <= since
+
+    seen = set()
+    pending = [(url, 0) for url in sitemap_urls]
+    while pending:
+        url, depth = pending.pop()
+        if url in seen:
+            continue
+        seen.add(url)
+
+        for entry in fetch(url):
+            if entry.is_index:
+                if depth < max_depth and not is_stale(entry):
+                    pending.append((entry.loc, depth + 1))
+            elif not is_stale(entry):
+                yield entry
+
+
+def load_last_crawl(domain: str, path: Path = SITEMAP_STATE_FILE) -> Optional[datetime]:
+    """
+    Read the time of the last completed crawl of a domain.
+
+    Args:
+        domain: Domain name, e.g. 'example.com'
+        path: JSON state file
+
+    Returns:
+        Datetime of the last crawl, or None if never crawled
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return parse_lastmod(state.get(domain))
+
+
+def save_last_crawl(domain: str, when: Optional[datetime] = None,
+                    path: Path = SITEMAP_STATE_FILE):
+    """
+    Record the time of a completed crawl of a domain.
+
+    Pass the time the crawl started, so pages modified while it ran are
+    picked up next time.
+
+    Args:
+        domain: Domain name, e.g. 'example.com'
+        when: Crawl time (defaults to now)
+        path: JSON state file
+    """
+    when = when or datetime.now(timezone.utc)
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        state = {}
+    state[domain] = when.isoformat()
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2)
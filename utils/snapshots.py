@@ -0,0 +1,181 @@
+"""
+DOM Snapshot Cache
+Persist rendered page_source from Selenium so extractors can be re-run
+offline with BeautifulSoup/lxml instead of re-rendering every page.
+
+Snapshots are gzip-compressed JSON files keyed by URL plus a hash of the
+render configuration (browser, headless mode, waits, ...), and expire
+after a TTL.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Iterator, Optional, Tuple
+
+from .config import SNAPSHOT_DIR, SNAPSHOT_TTL
+
+
+def render_config_hash(render_config: Optional[dict] = None) -> str:
+    """
+    Hash a render configuration so snapshots from different setups don't mix.
+
+    Args:
+        render_config: JSON-serialisable settings that affect the rendered DOM
+
+    Returns:
+        Short hex digest
+    """
+    payload = json.dumps(render_config or {}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+class SnapshotCache:
+    """
+    Compressed on-disk cache of rendered pages.
+
+    Example:
+        cache = SnapshotCache()
+        html = cache.get_or_render(url, render=lambda u: render_with_selenium(u),
+                                   render_config={'headless': True})
+        soup = BeautifulSoup(html, 'lxml')
+    """
+
+    def __init__(self, cache_dir: Path = SNAPSHOT_DIR, ttl: Optional[float] = SNAPSHOT_TTL):
+        """
+        Args:
+            cache_dir: Directory holding the snapshots
+            ttl: Maximum snapshot age in seconds (None never expires)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def path_for(self, url: str, render_config: Optional[dict] = None) -> Path:
+        """Return the snapshot path for a URL and render configuration."""
+        key = hashlib.sha256(f'{render_config_hash(render_config)} {url}'.encode('utf-8')).hexdigest()
+        return self.cache_dir / key[:2] / f'{key}.json.gz'
+
+    def _is_fresh(self, path: Path) -> bool:
+        if self.ttl is None:
+            return True
+        return time.time() - path.stat().st_mtime < self.ttl
+
+    def get(self, url: str, render_config: Optional[dict] = None) -> Optional[str]:
+        """
+        Return a cached page_source, or None if missing or expired.
+
+        Args:
+            url: Page URL
+            render_config: Render configuration used for the snapshot
+        """
+        path = self.path_for(url, render_config)
+        try:
+            if not self._is_fresh(path):
+                return None
+            with gzip.open(path, 'rt', encoding='utf-8') as f:
+                return json.load(f)['page_source']
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def put(self, url: str, page_source: str, render_config: Optional[dict] = None) -> Path:
+        """
+        Store a rendered page_source.
+
+        The file is written to a unique temporary file and moved into
+        place, so concurrent readers never see a partial snapshot and
+        concurrent writers of the same URL don't clobber each other.
+
+        Args:
+            url: Page URL
+            page_source: Rendered HTML (e.g. driver.page_source)
+            render_config: Render configuration used for the snapshot
+
+        Returns:
+            Path of the stored snapshot
+        """
+        path = self.path_for(url, render_config)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            'url': url,
+            'render_config': render_config or {},
+            'rendered_at': time.time(),
+            'page_source': page_source,
+        }
+        with tempfile.NamedTemporaryFile(dir=path.parent, prefix=f'{path.name}.',
+                                         suffix='.tmp', delete=False) as tmp:
+            try:
+                with gzip.open(tmp, 'wt', encoding='utf-8', compresslevel=6) as f:
+                    json.dump(record, f)
+            except BaseException:
+                tmp.close()
+                os.unlink(tmp.name)
+                raise
+        os.replace(tmp.name, path)
+        return path
+
+    def get_or_render(self, url: str, render: Callable[[str], str],
+                      render_config: Optional[dict] = None, refresh: bool = False) -> str:
+        """
+        Return the cached page_source, rendering and storing it on a miss.
+
+        Args:
+            url: Page URL
+            render: Function that renders url and returns its page_source
+            render_config: Render configuration (part of the cache key)
+            refresh: Ignore any cached snapshot and re-render
+
+        Returns:
+            Rendered HTML
+        """
+        if not refresh:
+            cached = self.get(url, render_config)
+            if cached is not None:
+                return cached
+        page_source = render(url)
+        self.put(url, page_source, render_config)
+        return page_source
+
+    def iter_snapshots(self, render_config: Optional[dict] = None,
+                       include_expired: bool = False) -> Iterator[Tuple[str, str]]:
+        """
+        Iterate over cached snapshots for offline re-extraction.
+
+        Args:
+            render_config: Only yield snapshots rendered with this
+                configuration (None yields all)
+            include_expired: Also yield snapshots older than the TTL
+
+        Yields:
+            (url, page_source) tuples
+        """
+        wanted = render_config_hash(render_config) if render_config is not None else None
+        for path in sorted(self.cache_dir.glob('*/*.json.gz')):
+            if not include_expired and not self._is_fresh(path):
+                continue
+            try:
+                with gzip.open(path, 'rt', encoding='utf-8') as f:
+                    record = json.load(f)
+                url, page_source = record['url'], record['page_source']
+            except (OSError, ValueError, KeyError, TypeError):
+                continue
+            if wanted is not None and render_config_hash(record.get('render_config')) != wanted:
+                continue
+            yield url, page_source
+
+    def purge_expired(self) -> int:
+        """
+        Delete expired snapshots.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for path in self.cache_dir.glob('*/*.json.gz'):
+            if not self._is_fresh(path):
+                path.unlink(missing_ok=True)
+                removed += 1
+        return removed
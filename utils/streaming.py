@@ -0,0 +1,240 @@
+"""
+Streaming Fetch Helpers
+Fetch pages in chunks with a size cap and stop early once enough has arrived.
+
+requests and lxml are imported on first use to keep worker startup fast.
+"""
+
+import time
+from typing import Callable, Iterator, Optional, Sequence
+
+from .config import (
+    ALLOWED_CONTENT_TYPES,
+    DEFAULT_TIMEOUT,
+    MAX_RESPONSE_BYTES,
+    STREAM_CHUNK_SIZE,
+)
+from .helpers import get_headers
+from .profiling import instrument, profiler
+
+
+class ResponseTooLarge(Exception):
+    """Raised when a response body grows past the configured size cap."""
+
+
+def is_allowed_content_type(response, allowed: Sequence[str] = ALLOWED_CONTENT_TYPES) -> bool:
+    """
+    Check the response Content-Type against an allow-list.
+
+    Args:
+        response: requests Response object
+        allowed: Accepted media types (e.g. 'text/html')
+
+    Returns:
+        True if allowed or no Content-Type was sent, False otherwise
+    """
+    content_type = response.headers.get('Content-Type')
+    if not content_type or not allowed:
+        return True
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    return media_type in allowed
+
+
+def iter_capped_chunks(response, max_bytes: int = MAX_RESPONSE_BYTES,
+                       chunk_size: int = STREAM_CHUNK_SIZE,
+                       check_declared: bool = True) -> Iterator[bytes]:
+    """
+    Yield body chunks from a streamed response, enforcing a size cap.
+
+    Args:
+        response: requests Response opened with stream=True
+        max_bytes: Maximum number of body bytes to read
+        chunk_size: Size of each read in bytes
+        check_declared: Reject up front if Content-Length exceeds max_bytes.
+            Disable when the consumer may stop early, so only the bytes
+            actually read count against the cap.
+
+    Yields:
+        Raw body chunks
+
+    Raises:
+        ResponseTooLarge: If the body exceeds max_bytes
+    """
+    declared = response.headers.get('Content-Length')
+    if check_declared and declared and declared.isdigit() and int(declared) > max_bytes:
+        raise ResponseTooLarge(f"Content-Length {declared} exceeds {max_bytes} bytes")
+
+    received = 0
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        if not chunk:
+            continue
+        received += len(chunk)
+        if received > max_bytes:
+            raise ResponseTooLarge(f"Body exceeds {max_bytes} bytes")
+        yield chunk
+
+
+def _consume_stream(url: str, consume: Callable, max_bytes: int,
+                    allowed_content_types: Sequence[str], chunk_size: int,
+                    headers: Optional[dict], timeout: float,
+                    check_declared: bool = True):
+    """Open a streamed request and hand its capped chunks to consume()."""
+    import requests
+
+    try:
+        with requests.get(url, headers=get_headers(headers), timeout=timeout,
+                          stream=True) as response:
+            response.raise_for_status()
+            if not is_allowed_content_type(response, allowed_content_types):
+                print(f"✗ Skipping {url}: content type {response.headers.get('Content-Type')}")
+                return None
+            return consume(iter_capped_chunks(response, max_bytes, chunk_size,
+                                              check_declared))
+    except ResponseTooLarge as e:
+        print(f"✗ Aborted {url}: {e}")
+        return None
+    except requests.exceptions.RequestException as e:
+        print(f"✗ Error fetching {url}: {e}")
+        return None
+
+
+@instrument('fetch')
+def fetch_streaming(url: str, max_bytes: int = MAX_RESPONSE_BYTES,
+                    allowed_content_types: Sequence[str] = ALLOWED_CONTENT_TYPES,
+                    chunk_size: int = STREAM_CHUNK_SIZE,
+                    headers: Optional[dict] = None,
+                    timeout: float = DEFAULT_TIMEOUT) -> Optional[bytes]:
+    """
+    Fetch a page body in chunks without ever holding more than max_bytes.
+
+    Args:
+        url: URL to fetch
+        max_bytes: Maximum body size; larger responses are aborted
+        allowed_content_types: Accepted media types
+        chunk_size: Size of each read in bytes
+        headers: Optional custom headers merged into the defaults
+        timeout: Request timeout in seconds
+
+    Returns:
+        Body bytes, or None if the fetch failed or was rejected
+    """
+    return _consume_stream(url, b''.join, max_bytes, allowed_content_types,
+                           chunk_size, headers, timeout)
+
+
+def stop_after_tag(tag: str) -> Callable:
+    """
+    Build a stop condition that fires once a closing tag has been parsed.
+
+    Args:
+        tag: Tag name, e.g. 'head'
+
+    Returns:
+        Predicate for stream_parse()
+    """
+    tag = tag.lower()
+    return lambda element: element.tag == tag
+
+
+def stop_after_class(class_name: str, tag: Optional[str] = None) -> Callable:
+    """
+    Build a stop condition that fires once an element with a class is complete.
+
+    Args:
+        class_name: CSS class to look for, e.g. 'product'
+        tag: Optional tag name the element must also have
+
+    Returns:
+        Predicate for stream_parse()
+    """
+    def predicate(element):
+        if tag and element.tag != tag:
+            return False
+        return class_name in (element.get('class') or '').split()
+    return predicate
+
+
+def _feed(chunks, until: Optional[Callable]):
+    """feed_until() that also returns the seconds spent parsing."""
+    from lxml import etree
+
+    parser = etree.HTMLPullParser(events=('end',) if until else ())
+    parse_time = 0.0
+    for chunk in chunks:
+        start = time.perf_counter()
+        parser.feed(chunk)
+        done = until is not None and any(until(element) for _, element in parser.read_events())
+        parse_time += time.perf_counter() - start
+        if done:
+            break
+
+    start = time.perf_counter()
+    try:
+        root = parser.close()
+    except etree.XMLSyntaxError:
+        root = None
+    return root, parse_time + time.perf_counter() - start
+
+
+def feed_until(chunks, until: Optional[Callable] = None):
+    """
+    Feed chunks to an incremental lxml HTML parser until a condition is met.
+
+    Time spent in the parser (not waiting for chunks) is recorded as the
+    'parse' stage.
+
+    Args:
+        chunks: Iterable of bytes chunks
+        until: Predicate called with each completed element; parsing
+            stops as soon as it returns True
+
+    Returns:
+        Root element of the (possibly partial) document, or None if empty
+    """
+    root, parse_time = _feed(chunks, until)
+    if profiler.enabled:
+        profiler.record('parse', parse_time)
+    return root
+
+
+def stream_parse(url: str, until: Optional[Callable] = None,
+                 max_bytes: int = MAX_RESPONSE_BYTES,
+                 allowed_content_types: Sequence[str] = ALLOWED_CONTENT_TYPES,
+                 chunk_size: int = STREAM_CHUNK_SIZE,
+                 headers: Optional[dict] = None,
+                 timeout: float = DEFAULT_TIMEOUT):
+    """
+    Fetch and parse a page incrementally, closing the connection early.
+
+    Network time is recorded as the 'fetch' stage and parser time as
+    'parse'. With a stop condition, pages larger than max_bytes are still parsed
+    as long as the condition fires before max_bytes have been read.
+
+    Args:
+        url: URL to fetch
+        until: Stop condition, e.g. stop_after_tag('head')
+        max_bytes: Maximum number of bytes to read; larger responses are aborted
+        allowed_content_types: Accepted media types
+        chunk_size: Size of each read in bytes
+        headers: Optional custom headers merged into the defaults
+        timeout: Request timeout in seconds
+
+    Returns:
+        lxml root element, or None if the fetch failed or was rejected
+    """
+    parse_times = []
+
+    def consume(chunks):
+        root, parse_time = _feed(chunks, until)
+        parse_times.append(parse_time)
+        return root
+
+    start = time.perf_counter()
+    root = _consume_stream(url, consume, max_bytes, allowed_content_types, chunk_size,
+                           headers, timeout, check_declared=until is None)
+    if profiler.enabled:
+        parse_time = sum(parse_times)
+        profiler.record('fetch', time.perf_counter() - start - parse_time)
+        if parse_times:
+            profiler.record('parse', parse_time)
+    return root
@@ -0,0 +1,258 @@
+"""
+Table Extraction
+Parse HTML <table> elements straight into columns (dict of lists),
+ready for pandas or Arrow, instead of building a dict per row.
+
+lxml, pandas and pyarrow are imported on first use.
+"""
+
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from .helpers import clean_price
+from .profiling import instrument
+
+Columns = Dict[str, list]
+
+
+def _cell_text(cell) -> str:
+    """Text content of a cell with whitespace collapsed."""
+    return ' '.join(cell.text_content().split())
+
+
+def _expand(cells) -> List[str]:
+    """Cell texts of a row, repeating cells that span several columns."""
+    values = []
+    for cell in cells:
+        text = _cell_text(cell)
+        span = cell.get('colspan', '1')
+        values.extend([text] * (int(span) if span.isdigit() and int(span) > 0 else 1))
+    return values
+
+
+def _unique_headers(headers: List[str]) -> List[str]:
+    """Fill blank header names and de-duplicate repeated ones."""
+    result = []
+    taken = set()
+    for i, header in enumerate(headers):
+        name = header or f'column_{i + 1}'
+        if name in taken or (not header and name in headers):
+            base, suffix = name, 1
+            while f'{base}_{suffix}' in taken or f'{base}_{suffix}' in headers:
+                suffix += 1
+            name = f'{base}_{suffix}'
+        taken.add(name)
+        result.append(name)
+    return result
+
+
+def coerce_column(values: list) -> list:
+    """
+    Convert a column to floats if every non-empty value is numeric.
+
+    Numbers are cleaned with clean_price(), so '$1,299.99' becomes
+    1299.99. Columns with any non-numeric value are returned unchanged.
+    Note that ID-like columns such as zip codes are numeric too, so
+    '02134' becomes 2134.0; pass coerce=False to keep them as text.
+
+    Args:
+        values: Column of strings (None or '' for missing cells)
+
+    Returns:
+        Column of floats/None, or the original values
+    """
+    numbers = []
+    for value in values:
+        if value is None or value == '':
+            numbers.append(None)
+            continue
+        number = clean_price(value)
+        if number is None:
+            return values
+        numbers.append(number)
+    return numbers
+
+
+def coerce_columns(columns: Columns) -> Columns:
+    """Apply coerce_column() to every column."""
+    return {name: coerce_column(values) for name, values in columns.items()}
+
+
+def table_to_columns(table, coerce: bool = True) -> Columns:
+    """
+    Convert one lxml <table> element to columns.
+
+    Headers come from <thead>, or from the first row if it contains only
+    <th> cells; otherwise columns are named column_1, column_2, ...
+
+    Args:
+        table: lxml.html element for a <table>
+        coerce: Convert numeric columns to floats
+
+    Returns:
+        Mapping of header to list of cell values
+    """
+    header_row = table.find('thead/tr')
+    rows = table.xpath('./tr | ./tbody/tr | ./tfoot/tr')
+    if header_row is None and rows and not rows[0].xpath('./td'):
+        header_row, rows = rows[0], rows[1:]
+
+    headers = _expand(header_row.xpath('./th | ./td')) if header_row is not None else []
+    columns = [[] for _ in headers]
+
+    for n, row in enumerate(rows):
+        values = _expand(row.xpath('./th | ./td'))
+        # Extra cells open new columns, missing cells are padded with None
+        while len(columns) < len(values):
+            headers.append('')
+            columns.append([None] * n)
+        for column, value in zip(columns, values):
+            column.append(value)
+        for column in columns[len(values):]:
+            column.append(None)
+
+    result = dict(zip(_unique_headers(headers), columns))
+    return coerce_columns(result) if coerce else result
+
+
+@instrument('extract')
+def read_tables(html, xpath: str = '//table', coerce: bool = True) -> List[Columns]:
+    """
+    Extract every matching table from an HTML document.
+
+    Args:
+        html: HTML string or bytes
+        xpath: XPath selecting the tables, e.g. '//table[@id="comparison"]'
+        coerce: Convert numeric columns to floats
+
+    Returns:
+        List of column mappings, one per table (empty for an empty document)
+    """
+    from lxml import etree
+    from lxml import html as lxml_html
+
+    parser = None
+    if isinstance(html, str):
+        # lxml rejects str input with an encoding declaration, so parse UTF-8 bytes
+        html = html.encode('utf-8')
+        parser = lxml_html.HTMLParser(encoding='utf-8')
+    if not html.strip():
+        return []
+    try:
+        document = lxml_html.fromstring(html, parser=parser)
+    except etree.ParserError:
+        return []
+    return [table_to_columns(table, coerce) for table in document.xpath(xpath)]
+
+
+def read_table(html, xpath: str = '//table', coerce: bool = True) -> Optional[Columns]:
+    """
+    Extract the first matching table from an HTML document.
+
+    Args:
+        html: HTML string or bytes
+        xpath: XPath selecting the table
+        coerce: Convert numeric columns to floats
+
+    Returns:
+        Column mapping, or None if no table matched
+    """
+    tables = read_tables(html, xpath, coerce)
+    return tables[0] if tables else None
+
+
+def concat_columns(batch: List[Columns]) -> Columns:
+    """
+    Concatenate column mappings, aligning columns by header name.
+
+    Args:
+        batch: Column mappings to combine
+
+    Returns:
+        Combined mapping; columns missing from a table are padded with None
+    """
+    names = []
+    for columns in batch:
+        names.extend(name for name in columns if name not in names)
+
+    combined = {name: [] for name in names}
+    for columns in batch:
+        length = len(next(iter(columns.values()), []))
+        for name in names:
+            combined[name].extend(columns.get(name, [None] * length))
+    return combined
+
+
+def read_tables_batched(pages: Iterable, xpath: str = '//table',
+                        batch_size: int = 100,
+                        source_column: Optional[str] = 'source') -> Iterator[Columns]:
+    """
+    Extract tables from many pages, yielding one combined column set per batch.
+
+    Columns are coerced once per batch, so a column's type is consistent
+    across all pages in the batch. The source column is never coerced.
+
+    Args:
+        pages: Iterable of (source, html) pairs, e.g. (url, body)
+        xpath: XPath selecting the tables on each page
+        batch_size: Number of pages per yielded batch
+        source_column: Name of the column recording each row's source,
+            or None to omit it. A table column with the same name is
+            renamed with a numeric suffix (e.g. 'source_1').
+
+    Yields:
+        Column mapping for each batch of pages
+    """
+    def flush(batch, sources):
+        combined = coerce_columns(concat_columns(batch))
+        if source_column:
+            if source_column in combined:
+                suffix = 1
+                while f'{source_column}_{suffix}' in combined:
+                    suffix += 1
+                combined = {(f'{source_column}_{suffix}' if name == source_column else name): values
+                            for name, values in combined.items()}
+            combined = {source_column: sources, **combined}
+        return combined
+
+    batch, sources = [], []
+    for count, (source, html) in enumerate(pages, 1):
+        for columns in read_tables(html, xpath, coerce=False):
+            batch.append(columns)
+            sources.extend([source] * len(next(iter(columns.values()), [])))
+        if count % batch_size == 0 and batch:
+            yield flush(batch, sources)
+            batch, sources = [], []
+    if batch:
+        yield flush(batch, sources)
+
+
+def to_dataframe(columns: Columns):
+    """
+    Build a pandas DataFrame from columns (numeric columns become float64).
+
+    Args:
+        columns: Column mapping from read_table() and friends
+
+    Returns:
+        pandas.DataFrame
+    """
+    import pandas as pd
+
+    return pd.DataFrame(columns)
+
+
+def to_arrow(columns: Columns):
+    """
+    Build a pyarrow Table from columns.
+
+    Requires pyarrow (pip install pyarrow).
+
+    Args:
+        columns: Column mapping from read_table() and friends
+
+    Returns:
+        pyarrow.Table
+    """
+    import pyarrow as pa
+
+    return pa.Table.from_pydict(columns)
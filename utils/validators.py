@@ -1,11 +1,35 @@
 """
 URL and Data Validators
 Functions to validate URLs and scraped data.
+
+Patterns are compiled once and URL parsing goes through a shared, bounded
+LRU cache, since the same links are validated over and over during a crawl.
+The validate_*/extract_domains variants take an iterable or pandas Series.
 """
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
-from typing import Optional
+from typing import Iterable, Optional
+
+from .config import URL_PARSE_CACHE_SIZE
+
+EMAIL_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
+
+@lru_cache(maxsize=URL_PARSE_CACHE_SIZE)
+def parse_url(url: str):
+    """
+    Memoized urlparse() shared by the URL validators.
+    
+    Args:
+        url: URL string
+    
+    Returns:
+        urllib.parse.ParseResult
+    """
+    return urlparse(url)
 
 def is_valid_url(url: str) -> bool:
     """
@@ -18,7 +42,7 @@ def is_valid_url(url: str) -> bool:
         True if valid, False otherwise
     """
     try:
-        result = urlparse(url)
+        result = parse_url(url)
         return all([result.scheme, result.netloc])
     except Exception:
         return False
@@ -33,8 +57,7 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(EMAIL_PATTERN.match(email))
 
 def sanitize_filename(filename: str) -> str:
     """
@@ -47,7 +70,7 @@ def sanitize_filename(filename: str) -> str:
         Sanitized filename
     """
     # Remove invalid characters
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = INVALID_FILENAME_CHARS.sub('', filename)
     # Replace spaces with underscores
     filename = filename.replace(' ', '_')
     # Limit length
@@ -64,7 +87,49 @@ def extract_domain(url: str) -> Optional[str]:
         Domain name or None if invalid
     """
     try:
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         return parsed.netloc
     except Exception:
         return None
+
+def _apply(func, values):
+    """Apply func to a pandas Series (keeping its index) or any iterable."""
+    if hasattr(values, 'map') and hasattr(values, 'index'):
+        return values.map(func)
+    return [func(value) for value in values]
+
+def validate_urls(urls: Iterable[str]):
+    """
+    Check many URLs at once.
+    
+    Args:
+        urls: Iterable or pandas Series of URL strings
+    
+    Returns:
+        List of booleans, or a boolean Series for Series input
+    """
+    return _apply(is_valid_url, urls)
+
+def validate_emails(emails: Iterable[str]):
+    """
+    Check many email addresses at once.
+    
+    Args:
+        emails: Iterable or pandas Series of email strings
+    
+    Returns:
+        List of booleans, or a boolean Series for Series input
+    """
+    return _apply(is_valid_email, emails)
+
+def extract_domains(urls: Iterable[str]):
+    """
+    Extract the domain of many URLs at once.
+    
+    Args:
+        urls: Iterable or pandas Series of URL strings
+    
+    Returns:
+        List of domains (None if invalid), or a Series for Series input
+    """
+    return _apply(extract_domain, urls)